@@ -0,0 +1,34 @@
+"""Shared executor for blocking AI computation."""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+# Minimax is pure Python and holds the GIL, so searches run in worker
+# processes to use more than one core.  One worker per CPU by default;
+# override with the CHESS_AI_WORKERS environment variable.  Workers are
+# spawned rather than forked because the server process is multi-threaded.
+#
+# The pool is created on first use rather than at import: spawned workers
+# import this module too (through api.session) and must not start pools
+# of their own.
+_ai_executor: Optional[ProcessPoolExecutor] = None
+
+
+def get_ai_executor() -> ProcessPoolExecutor:
+    """Return the shared pool, creating it on first use."""
+    global _ai_executor
+    if _ai_executor is None:
+        _ai_executor = ProcessPoolExecutor(
+            max_workers=int(os.environ.get('CHESS_AI_WORKERS', os.cpu_count() or 4)),
+            mp_context=multiprocessing.get_context('spawn'),
+        )
+    return _ai_executor
+
+
+def shutdown_ai_executor() -> None:
+    """Stop the pool's workers, dropping searches not yet started."""
+    global _ai_executor
+    if _ai_executor is not None:
+        _ai_executor.shutdown(wait=True, cancel_futures=True)
+        _ai_executor = None
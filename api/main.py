@@ -1,4 +1,6 @@
 """FastAPI application factory."""
+import asyncio
+import contextlib
 import os
 
 from fastapi import FastAPI, Request
@@ -6,15 +8,41 @@ from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
+from api.executor import shutdown_ai_executor
+from api.responses import ORJSONResponse
+
 _BASE = os.path.dirname(__file__)
 _WEB = os.path.join(_BASE, '..', 'web')
 
+# Seconds between sweeps for idle sessions
+SESSION_EXPIRY_INTERVAL = 60
+
+
+async def _expire_sessions() -> None:
+    from api.session import session_manager
+
+    while True:
+        await asyncio.sleep(SESSION_EXPIRY_INTERVAL)
+        session_manager.expire()
+
+
+@contextlib.asynccontextmanager
+async def _lifespan(application: FastAPI):
+    task = asyncio.create_task(_expire_sessions())
+    try:
+        yield
+    finally:
+        task.cancel()
+        shutdown_ai_executor()
+
 
 def create_app() -> FastAPI:
     application = FastAPI(
         title='Chess Web App',
         description='Python chess engine with pluggable evaluators and three game modes.',
         version='0.1.0',
+        default_response_class=ORJSONResponse,
+        lifespan=_lifespan,
     )
 
     # Routers
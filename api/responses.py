@@ -0,0 +1,17 @@
+"""Response classes shared by the REST routes."""
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson instead of the stdlib encoder.
+
+    Defined locally because recent FastAPI releases deprecate their bundled
+    ``ORJSONResponse``; the rendering is identical.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -1,15 +1,17 @@
 """REST endpoints."""
+import orjson
 from fastapi import APIRouter, HTTPException
 
-from api.schemas import NewGameRequest, NewGameResponse, GameStateResponse, ResignRequest
+from api.responses import ORJSONResponse
+from api.schemas import NewGameRequest, ResignRequest
 from api.session import session_manager, EVALUATOR_REGISTRY
 from engine.constants import Color
 
 router = APIRouter(prefix='/api')
 
 
-@router.post('/new_game', response_model=NewGameResponse)
-def new_game(req: NewGameRequest):
+@router.post('/new_game')
+async def new_game(req: NewGameRequest):
     """Create a new game session and return its ID."""
     if req.white_evaluator and req.white_evaluator not in EVALUATOR_REGISTRY:
         raise HTTPException(400, f'Unknown evaluator: {req.white_evaluator!r}')
@@ -36,30 +38,34 @@ def new_game(req: NewGameRequest):
         req.white_depth,
         req.black_depth,
     )
-    return NewGameResponse(session_id=session.session_id, mode=req.mode)
+    return ORJSONResponse({'session_id': session.session_id, 'mode': req.mode})
 
 
-@router.get('/state/{session_id}', response_model=GameStateResponse)
-def get_state(session_id: str):
+@router.get('/state/{session_id}')
+async def get_state(session_id: str):
     """Return the full serialised game state."""
     session = session_manager.get(session_id)
     if not session:
         raise HTTPException(404, 'Session not found')
-    return GameStateResponse(session_id=session_id, state=session.game.to_dict())
+    # Embeds the session's cached serialisation instead of re-encoding it
+    return ORJSONResponse({
+        'session_id': session_id,
+        'state': orjson.Fragment(session.state_json()),
+    })
 
 
 @router.post('/resign/{session_id}')
-def resign(session_id: str, req: ResignRequest):
+async def resign(session_id: str, req: ResignRequest):
     """Resign the game for one side."""
     session = session_manager.get(session_id)
     if not session:
         raise HTTPException(404, 'Session not found')
     color = Color.WHITE if req.color == 'white' else Color.BLACK
-    session.game.resign(color)
+    session.resign(color)
     return {'result': session.game.result}
 
 
 @router.get('/evaluators')
-def list_evaluators():
+async def list_evaluators():
     """Return the names of all registered evaluators."""
     return {'evaluators': sorted(EVALUATOR_REGISTRY.keys())}
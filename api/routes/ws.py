@@ -1,11 +1,12 @@
 """WebSocket endpoint — full message protocol."""
 import asyncio
-import json
 import logging
-from concurrent.futures import ThreadPoolExecutor
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from pydantic import ValidationError
 
+from api.schemas import MoveMessage
 from api.session import session_manager
 from engine.constants import Color
 from engine.game import GameResult
@@ -13,8 +14,6 @@ from engine.game import GameResult
 log = logging.getLogger(__name__)
 router = APIRouter()
 
-_executor = ThreadPoolExecutor(max_workers=4)
-
 
 # ---------------------------------------------------------------------------
 # Main endpoint
@@ -28,32 +27,45 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
         return
 
     await websocket.accept()
-    session.websocket = websocket
+    session.websockets.add(websocket)
+    session.disconnected = False
     log.info('WS connected: %s', session_id)
 
     # Send initial board state
     await _send_state(websocket, session)
 
-    # For CvC start the AI game loop in the background
-    cvc_task = None
+    # For CvC start the AI game loop in the background; it ends itself once
+    # this connection's *stop* is set.  Each connection has its own event,
+    # so a second tab on the same session closing does not stop this one's
+    # loop.
+    stop = asyncio.Event()
     if session.mode == 'cvc':
-        cvc_task = asyncio.create_task(_cvc_loop(session, websocket))
+        cvc_task = asyncio.create_task(
+            _cvc_loop(session, websocket, stop), name=f'CvC loop {session_id}',
+        )
+        cvc_task.add_done_callback(_log_task_failure)
 
     try:
         while True:
-            raw = await websocket.receive_text()
+            raw = await _receive_raw(websocket)
             try:
-                msg = json.loads(raw)
-            except json.JSONDecodeError:
-                await websocket.send_json({'type': 'error', 'message': 'Invalid JSON'})
+                msg = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                await _send(websocket, {'type': 'error', 'message': 'Invalid JSON'})
                 continue
             await _handle(msg, session, websocket)
     except WebSocketDisconnect:
         log.info('WS disconnected: %s', session_id)
     finally:
-        session.websocket = None
-        if cvc_task:
-            cvc_task.cancel()
+        # Stops the CvC loop, abandoning any AI move still in flight
+        stop.set()
+        # Another socket may still be open on the session; only the last
+        # one to close starts the disconnect grace period
+        session.websockets.discard(websocket)
+        if not session.websockets:
+            session.disconnected = True
+        # Starts the idle clock for eviction
+        session_manager.touch(session)
 
 
 # ---------------------------------------------------------------------------
@@ -64,37 +76,35 @@ async def _handle(msg: dict, session, websocket: WebSocket) -> None:
     msg_type = msg.get('type')
 
     if msg_type == 'ping':
-        await websocket.send_json({'type': 'pong'})
+        await _send(websocket, {'type': 'pong'})
         return
 
     if msg_type == 'resign':
         color_str = msg.get('color', 'white')
         color = Color.WHITE if color_str == 'white' else Color.BLACK
-        session.game.resign(color)
+        session.resign(color)
         await _send_state(websocket, session)
         await _maybe_game_over(websocket, session)
         return
 
     if msg_type == 'move':
         if session.game.result != GameResult.ONGOING:
-            await websocket.send_json({'type': 'error', 'message': 'Game is over'})
+            await _send(websocket, {'type': 'error', 'message': 'Game is over'})
             return
 
         if not session.is_human_turn():
-            await websocket.send_json({'type': 'error', 'message': 'Not a human turn'})
+            await _send(websocket, {'type': 'error', 'message': 'Not a human turn'})
             return
 
-        from_sq = msg.get('from_sq')
-        to_sq = msg.get('to_sq')
-        promotion = msg.get('promotion')
-
-        if from_sq is None or to_sq is None:
-            await websocket.send_json({'type': 'error', 'message': 'Missing from_sq/to_sq'})
+        try:
+            move_msg = MoveMessage.model_validate(msg)
+        except ValidationError as exc:
+            await _send(websocket, {'type': 'error', 'message': _format_errors(exc)})
             return
 
-        ok, err = session.make_move(int(from_sq), int(to_sq), promotion)
+        ok, err = session.make_move(move_msg.from_sq, move_msg.to_sq, move_msg.promotion)
         if not ok:
-            await websocket.send_json({'type': 'error', 'message': err})
+            await _send(websocket, {'type': 'error', 'message': err})
             return
 
         await _send_state(websocket, session)
@@ -108,7 +118,7 @@ async def _handle(msg: dict, session, websocket: WebSocket) -> None:
             await _run_ai_move(session, websocket)
         return
 
-    await websocket.send_json({'type': 'error', 'message': f'Unknown message type: {msg_type!r}'})
+    await _send(websocket, {'type': 'error', 'message': f'Unknown message type: {msg_type!r}'})
 
 
 # ---------------------------------------------------------------------------
@@ -116,39 +126,97 @@ async def _handle(msg: dict, session, websocket: WebSocket) -> None:
 # ---------------------------------------------------------------------------
 
 async def _run_ai_move(session, websocket: WebSocket) -> None:
-    """Compute one AI move in the executor and broadcast it."""
-    await websocket.send_json({'type': 'ai_thinking'})
-    loop = asyncio.get_event_loop()
+    """
+    Compute one AI move in the process pool and broadcast it.
+
+    The move, the resulting state and any game-over result go out together
+    as a single ``ai_turn`` frame.
+    """
+    future = session.compute_ai_move()
+    if future is None:
+        return
+    await _send(websocket, {'type': 'ai_thinking'})
     try:
-        move = await loop.run_in_executor(_executor, session.compute_ai_move)
+        uci = await asyncio.wrap_future(future)
     except Exception as exc:
         log.exception('AI error: %s', exc)
-        await websocket.send_json({'type': 'error', 'message': 'AI computation failed'})
+        await _send(websocket, {'type': 'error', 'message': 'AI computation failed'})
         return
 
+    move = session.move_from_uci(uci) if uci is not None else None
     if move is None:
         return
 
-    session.game.make_move(move)
-    await websocket.send_json({
-        'type': 'ai_move',
-        'from_sq': move.from_sq,
-        'to_sq': move.to_sq,
-        'promotion': move.promotion.name if move.promotion else None,
-        'uci': move.uci(),
-    })
-    await _send_state(websocket, session)
-    await _maybe_game_over(websocket, session)
+    session.apply_move(move)
+    payload = {
+        'type': 'ai_turn',
+        'move': {
+            'from_sq': move.from_sq,
+            'to_sq': move.to_sq,
+            'promotion': move.promotion.name if move.promotion else None,
+            'uci': move.uci(),
+        },
+        # Embeds the cached serialisation instead of re-encoding the state
+        'state': orjson.Fragment(session.state_json()),
+    }
+    if session.game.result != GameResult.ONGOING:
+        payload['game_over'] = {
+            'result': session.game.result,
+            'reason': session.game.draw_reason,
+        }
+    await _send(websocket, payload)
+
+
+async def _cvc_loop(session, websocket: WebSocket, stop: asyncio.Event) -> None:
+    """
+    Drive a Computer-vs-Computer game; server pushes each move.
+
+    Every AI move and pause is raced against *stop*, set when this
+    connection closes, so the loop stops, and cancels the pending search,
+    as soon as the client goes away.
+    """
+    disconnected = asyncio.create_task(stop.wait())
+    try:
+        await asyncio.wait({disconnected}, timeout=0.3)
+        while session.game.result == GameResult.ONGOING and not disconnected.done():
+            ai_task = asyncio.create_task(_run_ai_move(session, websocket))
+            await asyncio.wait({ai_task, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+            if not ai_task.done():
+                ai_task.cancel()
+                break
+            ai_task.result()  # re-raise anything the move raised
+            await asyncio.wait({disconnected}, timeout=0.5)
+    finally:
+        disconnected.cancel()
 
 
-async def _cvc_loop(session, websocket: WebSocket) -> None:
-    """Drive a Computer-vs-Computer game; server pushes each move."""
-    await asyncio.sleep(0.3)
-    while session.game.result == GameResult.ONGOING:
-        if websocket.client_state.value != 1:  # CONNECTED
-            break
-        await _run_ai_move(session, websocket)
-        await asyncio.sleep(0.5)
+def _log_task_failure(task: asyncio.Task) -> None:
+    """Done-callback: log the exception a background task ended with, if any."""
+    if not task.cancelled() and task.exception() is not None:
+        log.error('%s failed', task.get_name(), exc_info=task.exception())
+
+
+# ---------------------------------------------------------------------------
+# Frame I/O
+# ---------------------------------------------------------------------------
+
+async def _receive_raw(websocket: WebSocket) -> bytes | str:
+    """
+    Return the payload of the next frame without decoding it.
+
+    Browsers send text frames; binary frames are accepted too.  orjson
+    parses either, so the text is never re-encoded.
+    """
+    message = await websocket.receive()
+    if message['type'] == 'websocket.disconnect':
+        raise WebSocketDisconnect(message.get('code', 1000), message.get('reason'))
+    raw = message.get('bytes')
+    return raw if raw is not None else message.get('text', '')
+
+
+async def _send(websocket: WebSocket, payload: dict) -> None:
+    """Serialise *payload* with orjson and send it as a binary frame."""
+    await websocket.send_bytes(orjson.dumps(payload))
 
 
 # ---------------------------------------------------------------------------
@@ -156,16 +224,20 @@ async def _cvc_loop(session, websocket: WebSocket) -> None:
 # ---------------------------------------------------------------------------
 
 async def _send_state(websocket: WebSocket, session) -> None:
-    await websocket.send_json({
-        'type': 'state',
-        'session_id': session.session_id,
-        'state': session.game.to_dict(),
-    })
+    await websocket.send_bytes(session.state_bytes())
+
+
+def _format_errors(exc: ValidationError) -> str:
+    """One-line summary of a ValidationError, e.g. ``from_sq: Field required``."""
+    return '; '.join(
+        f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}"
+        for err in exc.errors()
+    )
 
 
 async def _maybe_game_over(websocket: WebSocket, session) -> None:
     if session.game.result != GameResult.ONGOING:
-        await websocket.send_json({
+        await _send(websocket, {
             'type': 'game_over',
             'result': session.game.result,
             'reason': session.game.draw_reason,
@@ -1,7 +1,7 @@
-"""Pydantic request/response models for the REST API."""
+"""Pydantic request models for the REST and WebSocket APIs."""
 from typing import Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class NewGameRequest(BaseModel):
@@ -18,15 +18,18 @@ class NewGameRequest(BaseModel):
     black_depth: int = Field(default=3, ge=1, le=6)
 
 
-class NewGameResponse(BaseModel):
-    session_id: str
-    mode: str
-
+class ResignRequest(BaseModel):
+    color: Literal['white', 'black'] = 'white'
 
-class GameStateResponse(BaseModel):
-    session_id: str
-    state: dict
 
+class MoveMessage(BaseModel):
+    """A client ``move`` message received over the WebSocket."""
+    from_sq: int = Field(ge=0, le=63)
+    to_sq: int = Field(ge=0, le=63)
+    promotion: Optional[Literal['QUEEN', 'ROOK', 'BISHOP', 'KNIGHT']] = None
 
-class ResignRequest(BaseModel):
-    color: Literal['white', 'black'] = 'white'
+    @field_validator('promotion', mode='before')
+    @classmethod
+    def _upper_promotion(cls, value):
+        # Promotion names are accepted case-insensitively
+        return value.upper() if isinstance(value, str) else value
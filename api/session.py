@@ -1,8 +1,14 @@
 """Session management and the evaluator registry."""
+import time
 import uuid
-from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from concurrent.futures import Future
 from typing import Optional
 
+import orjson
+
+from api.executor import get_ai_executor
+from engine.board import Board
 from engine.constants import Color, PieceType
 from engine.game import GameState
 from engine.move import Move
@@ -23,15 +29,53 @@ EVALUATOR_REGISTRY: dict[str, type] = {
     'positional': PositionalEvaluator,
 }
 
-# Shared thread-pool for blocking AI computation
-_executor = ThreadPoolExecutor(max_workers=4)
+# Promotion names accepted from clients (case-insensitive)
+_PROMO_MAP: dict[str, PieceType] = {
+    'QUEEN':  PieceType.QUEEN,
+    'ROOK':   PieceType.ROOK,
+    'BISHOP': PieceType.BISHOP,
+    'KNIGHT': PieceType.KNIGHT,
+}
+
+
+# Searchers kept by each pool worker process, one per evaluator key, so the
+# transposition table carries over from one AI move to the next.  Entries
+# record the depth they were searched to, so every depth can share a table.
+_worker_searchers: dict[str, MinimaxSearcher] = {}
+
+
+def _ai_move_worker(board: Board, evaluator_key: str, depth: int) -> Optional[str]:
+    """
+    Process-pool entry point: search *board* and return the best move as UCI.
+
+    Module-level so it can be pickled by reference; the board is submitted
+    as a snapshot and arrives as a history-free copy.  *evaluator_key* is
+    the evaluator's EVALUATOR_REGISTRY key.
+    """
+    searcher = _worker_searchers.get(evaluator_key)
+    if searcher is None:
+        searcher = MinimaxSearcher(EVALUATOR_REGISTRY[evaluator_key](), depth)
+        _worker_searchers[evaluator_key] = searcher
+    searcher.depth = depth
+    move = searcher.best_move(GameState(board))
+    return move.uci() if move is not None else None
 
 
 # ---------------------------------------------------------------------------
 # GameSession
 # ---------------------------------------------------------------------------
 
+# An AI player: (EVALUATOR_REGISTRY key, search depth)
+AIConfig = tuple[str, int]
+
+
 class GameSession:
+    __slots__ = (
+        'session_id', 'mode', 'game', 'websockets', 'disconnected', 'last_active',
+        '_state_cache_bytes', '_state_prefix_bytes',
+        'white_ai', 'black_ai',
+    )
+
     def __init__(
         self,
         session_id: str,
@@ -44,30 +88,43 @@ class GameSession:
         self.session_id = session_id
         self.mode = mode
         self.game = GameState()
-        self.websocket = None  # set by the WS route
+        # Open sockets on this session (a second tab, or a reconnect racing
+        # the old socket's close); kept by the WS route
+        self.websockets: set = set()
+        # Set by the WS route when the session's last socket closes, cleared
+        # on reconnect; expire() then allows only the disconnect grace period
+        self.disconnected = False
+        # time.monotonic() of the last lookup or disconnect; drives eviction
+        self.last_active = time.monotonic()
+        # Serialised game.to_dict(); cleared whenever the game changes.
+        # Everything before it in the ``state`` message is fixed for the session.
+        self._state_cache_bytes: Optional[bytes] = None
+        self._state_prefix_bytes = (
+            b'{"type":"state","session_id":' + orjson.dumps(session_id) + b',"state":'
+        )
 
-        self.white_searcher: Optional[MinimaxSearcher] = None
-        self.black_searcher: Optional[MinimaxSearcher] = None
+        # The searches themselves run in the process pool, so a side's AI is
+        # only its config; None means a human plays that side
+        self.white_ai: Optional[AIConfig] = None
+        self.black_ai: Optional[AIConfig] = None
 
         if white_evaluator_name and white_evaluator_name in EVALUATOR_REGISTRY:
-            ev = EVALUATOR_REGISTRY[white_evaluator_name]()
-            self.white_searcher = MinimaxSearcher(ev, white_depth)
+            self.white_ai = (white_evaluator_name, white_depth)
 
         if black_evaluator_name and black_evaluator_name in EVALUATOR_REGISTRY:
-            ev = EVALUATOR_REGISTRY[black_evaluator_name]()
-            self.black_searcher = MinimaxSearcher(ev, black_depth)
+            self.black_ai = (black_evaluator_name, black_depth)
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
-    def current_searcher(self) -> Optional[MinimaxSearcher]:
-        """Return the searcher for the side that is currently to move."""
-        return self.white_searcher if self.game.board.turn == Color.WHITE else self.black_searcher
+    def current_ai(self) -> Optional[AIConfig]:
+        """Return the AI config for the side that is currently to move."""
+        return self.white_ai if self.game.board.turn == Color.WHITE else self.black_ai
 
     def is_human_turn(self) -> bool:
         """True when no AI is configured for the side to move."""
-        return self.current_searcher() is None
+        return self.current_ai() is None
 
     def make_move(
         self,
@@ -80,34 +137,62 @@ class GameSession:
         The *is_castle* / *is_en_passant* flags are resolved by matching
         against the legal-move list.
         """
-        promo_pt: Optional[PieceType] = None
-        if promotion:
-            promo_map = {
-                'QUEEN':  PieceType.QUEEN,
-                'ROOK':   PieceType.ROOK,
-                'BISHOP': PieceType.BISHOP,
-                'KNIGHT': PieceType.KNIGHT,
-            }
-            promo_pt = promo_map.get(promotion.upper())
-
-        matched: Optional[Move] = None
-        for lm in self.game.legal_moves:
-            if lm.from_sq == from_sq and lm.to_sq == to_sq and lm.promotion == promo_pt:
-                matched = lm
-                break
+        promo_pt = _PROMO_MAP.get(promotion.upper()) if promotion else None
 
+        matched = self.game.legal_moves_by_key.get((from_sq, to_sq, promo_pt))
         if matched is None:
             return False, 'Illegal move'
 
-        ok = self.game.make_move(matched)
+        ok = self.apply_move(matched)
         return ok, ''
 
-    def compute_ai_move(self) -> Optional[Move]:
-        """Compute the best move for the AI side (blocking — run in executor)."""
-        searcher = self.current_searcher()
-        if searcher is None:
+    def apply_move(self, move: Move) -> bool:
+        """Play an already-resolved move (human or AI) on the game."""
+        self._state_cache_bytes = None
+        return self.game.make_move(move)
+
+    def resign(self, color: Color) -> None:
+        """Resign the game for *color*."""
+        self._state_cache_bytes = None
+        self.game.resign(color)
+
+    def state_json(self) -> bytes:
+        """
+        ``game.to_dict()`` as JSON bytes.
+
+        Serialised once per position and reused until the next move or
+        resignation.
+        """
+        if self._state_cache_bytes is None:
+            self._state_cache_bytes = orjson.dumps(self.game.to_dict())
+        return self._state_cache_bytes
+
+    def state_bytes(self) -> bytes:
+        """The ``state`` WebSocket message as JSON bytes."""
+        return self._state_prefix_bytes + self.state_json() + b'}'
+
+    def compute_ai_move(self) -> Optional['Future[Optional[str]]']:
+        """
+        Start the AI search for the side to move in the shared process pool.
+
+        Returns a future resolving to the chosen move in UCI notation (None
+        if there is no move), or None when no AI plays the side to move.
+        Resolve the result with ``move_from_uci``.
+        """
+        ai = self.current_ai()
+        if ai is None:
             return None
-        return searcher.best_move(self.game)
+        evaluator_key, depth = ai
+        # The snapshot is pickled later, on the executor's feeder thread; it
+        # holds its own copy of the position, so the board may change first
+        return get_ai_executor().submit(
+            _ai_move_worker, self.game.board.snapshot(), evaluator_key, depth,
+        )
+
+    def move_from_uci(self, uci: str) -> Optional[Move]:
+        """Map a UCI string to the matching legal move (with its flags), if any."""
+        move = Move.from_uci(uci)
+        return self.game.legal_moves_by_key.get((move.from_sq, move.to_sq, move.promotion))
 
 
 # ---------------------------------------------------------------------------
@@ -115,8 +200,28 @@ class GameSession:
 # ---------------------------------------------------------------------------
 
 class SessionManager:
-    def __init__(self) -> None:
-        self._sessions: dict[str, GameSession] = {}
+    """
+    In-memory session store with LRU + idle-time eviction.
+
+    Sessions are kept in least-recently-used order.  ``expire()`` drops
+    sessions without a live WebSocket once they have been idle for *ttl*
+    seconds, or for *disconnect_grace* seconds after their socket closed.
+    Creating a session beyond *max_sessions* evicts the least recently
+    used one without a live WebSocket, or the least recently used of all
+    if every session has one.
+    """
+    __slots__ = ('_sessions', 'max_sessions', 'ttl', 'disconnect_grace')
+
+    def __init__(
+        self,
+        max_sessions: int = 10_000,
+        ttl: float = 3600.0,
+        disconnect_grace: float = 600.0,
+    ) -> None:
+        self._sessions: OrderedDict[str, GameSession] = OrderedDict()
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self.disconnect_grace = disconnect_grace
 
     def create_session(
         self,
@@ -132,15 +237,52 @@ class SessionManager:
             white_evaluator, black_evaluator,
             white_depth, black_depth,
         )
+        while len(self._sessions) >= self.max_sessions:
+            self._evict_one()
         self._sessions[session_id] = session
         return session
 
+    def _evict_one(self) -> None:
+        """Drop the least recently used session, sparing ones with a socket."""
+        for session_id, session in self._sessions.items():
+            if not session.websockets:
+                del self._sessions[session_id]
+                return
+        self._sessions.popitem(last=False)
+
     def get(self, session_id: str) -> Optional[GameSession]:
-        return self._sessions.get(session_id)
+        session = self._sessions.get(session_id)
+        if session is not None:
+            self.touch(session)
+        return session
+
+    def touch(self, session: GameSession) -> None:
+        """Mark *session* as just used."""
+        session.last_active = time.monotonic()
+        if session.session_id in self._sessions:
+            self._sessions.move_to_end(session.session_id)
 
     def delete(self, session_id: str) -> None:
         self._sessions.pop(session_id, None)
 
+    def expire(self) -> int:
+        """Drop idle sessions; returns how many were removed."""
+        now = time.monotonic()
+        stale = [
+            session_id
+            for session_id, session in self._sessions.items()
+            if not session.websockets
+            and now - session.last_active > (
+                self.disconnect_grace if session.disconnected else self.ttl
+            )
+        ]
+        for session_id in stale:
+            del self._sessions[session_id]
+        return len(stale)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
 
 # Singleton used by both REST and WS routes
 session_manager = SessionManager()
@@ -0,0 +1,139 @@
+"""
+Precomputed attack tables for bitboard move generation.
+
+Bitboards are Python ints with bit *s* standing for square *s* (same
+indexing as Board: s = row * 8 + col, row 0 = rank 8).
+
+Leaper attacks are plain 64-entry tables.  Slider attacks use the idea
+behind magic bitboards — index a per-square table by the occupancy of the
+squares that can block — but a dict keyed by ``occ & mask`` takes the place
+of the magic multiply-and-shift, since Python hashes ints directly.
+"""
+BB_ALL = (1 << 64) - 1
+
+FILE_A = sum(1 << (row * 8) for row in range(8))
+FILE_H = FILE_A << 7
+
+_ORTH = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+_DIAG = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+_KNIGHT_DELTAS = [(-2, -1), (-2, 1), (-1, -2), (-1, 2), (1, -2), (1, 2), (2, -1), (2, 1)]
+_KING_DELTAS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+
+
+def _leaper_table(deltas: list[tuple[int, int]]) -> tuple[int, ...]:
+    table = []
+    for s in range(64):
+        row, col = divmod(s, 8)
+        attacks = 0
+        for dr, dc in deltas:
+            r, c = row + dr, col + dc
+            if 0 <= r <= 7 and 0 <= c <= 7:
+                attacks |= 1 << (r * 8 + c)
+        table.append(attacks)
+    return tuple(table)
+
+
+KNIGHT_ATTACKS = _leaper_table(_KNIGHT_DELTAS)
+KING_ATTACKS = _leaper_table(_KING_DELTAS)
+
+# PAWN_ATTACKS[color][s]: squares a *color* pawn on *s* attacks
+PAWN_ATTACKS = (
+    _leaper_table([(-1, -1), (-1, 1)]),  # white pawns move towards row 0
+    _leaper_table([(1, -1), (1, 1)]),    # black pawns move towards row 7
+)
+
+
+def _ray(s: int, dr: int, dc: int) -> list[int]:
+    """Squares from *s* (exclusive) to the board edge in direction (dr, dc)."""
+    row, col = divmod(s, 8)
+    squares = []
+    r, c = row + dr, col + dc
+    while 0 <= r <= 7 and 0 <= c <= 7:
+        squares.append(r * 8 + c)
+        r += dr
+        c += dc
+    return squares
+
+
+def _line_tables() -> tuple[tuple[tuple[int, ...], ...], tuple[tuple[int, ...], ...]]:
+    """
+    Build (BETWEEN, LINE).
+
+    ``BETWEEN[a][b]`` holds the squares strictly between *a* and *b* and
+    ``LINE[a][b]`` the whole board-edge-to-edge line through both, when the
+    two share a rank, file or diagonal; otherwise both are 0.
+    """
+    between = [[0] * 64 for _ in range(64)]
+    line = [[0] * 64 for _ in range(64)]
+    for a in range(64):
+        for dr, dc in _ORTH + _DIAG:
+            forward = _ray(a, dr, dc)
+            full = (1 << a) | sum(1 << t for t in forward + _ray(a, -dr, -dc))
+            gap = 0
+            for b in forward:
+                between[a][b] = gap
+                line[a][b] = full
+                gap |= 1 << b
+    return tuple(map(tuple, between)), tuple(map(tuple, line))
+
+
+def _slider_tables(directions: list[tuple[int, int]]) -> tuple[tuple[int, ...], tuple[dict[int, int], ...]]:
+    """
+    Build (masks, tables) for a slider moving along *directions*.
+
+    ``tables[s][occ & masks[s]]`` is the attack set from *s* given the
+    occupancy *occ*.  The edge square of each ray never blocks anything
+    further, so it is left out of the mask.
+    """
+    masks = []
+    tables = []
+    for s in range(64):
+        mask = 0
+        table = {0: 0}
+        for dr, dc in directions:
+            ray = _ray(s, dr, dc)
+            if not ray:
+                continue
+            inner = ray[:-1]
+            # (blockers, attacks) for every blocker subset along this ray
+            options = []
+            for subset in range(1 << len(inner)):
+                blockers = 0
+                for i, t in enumerate(inner):
+                    if subset >> i & 1:
+                        blockers |= 1 << t
+                # The ray runs up to and including the first blocker
+                attacks = 0
+                for t in ray:
+                    attacks |= 1 << t
+                    if blockers >> t & 1:
+                        break
+                options.append((blockers, attacks))
+            table = {
+                occ | blockers: attacks_so_far | attacks
+                for occ, attacks_so_far in table.items()
+                for blockers, attacks in options
+            }
+            for t in inner:
+                mask |= 1 << t
+        masks.append(mask)
+        tables.append(table)
+    return tuple(masks), tuple(tables)
+
+
+ROOK_MASKS, ROOK_TABLES = _slider_tables(_ORTH)
+BISHOP_MASKS, BISHOP_TABLES = _slider_tables(_DIAG)
+BETWEEN, LINE = _line_tables()
+
+
+def rook_attacks(s: int, occ: int) -> int:
+    return ROOK_TABLES[s][occ & ROOK_MASKS[s]]
+
+
+def bishop_attacks(s: int, occ: int) -> int:
+    return BISHOP_TABLES[s][occ & BISHOP_MASKS[s]]
+
+
+def queen_attacks(s: int, occ: int) -> int:
+    return ROOK_TABLES[s][occ & ROOK_MASKS[s]] | BISHOP_TABLES[s][occ & BISHOP_MASKS[s]]
+
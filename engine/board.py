@@ -1,7 +1,18 @@
-from typing import Optional
-
-from engine.constants import Color, PieceType, sq, row_col
-from engine.move import Move
+from typing import Iterable, Iterator, Mapping, Optional
+
+from engine.constants import (
+    CASTLING_FLAGS,
+    CR_ALL,
+    CR_BK,
+    CR_BQ,
+    CR_WK,
+    CR_WQ,
+    PIECE_VALUES,
+    Color,
+    PieceType,
+)
+from engine.move import CASTLE_FLAG, EP_FLAG, PROMO_SHIFT, TO_SHIFT, Move
+from engine.zobrist import BLACK_TO_MOVE_KEY, CASTLING_KEYS, EP_FILE_KEYS, PIECE_KEYS
 
 # (Color, PieceType) tuple
 Piece = tuple[Color, PieceType]
@@ -17,6 +28,36 @@ _BACK_RANK: list[PieceType] = [
     PieceType.ROOK,
 ]
 
+# Castling squares (square = row * 8 + col; row 7 = rank 1, row 0 = rank 8)
+_WK_KING_TO, _WK_ROOK_FROM, _WK_ROOK_TO = 62, 63, 61  # White O-O:   e1g1, h1f1
+_WQ_KING_TO, _WQ_ROOK_FROM, _WQ_ROOK_TO = 58, 56, 59  # White O-O-O: e1c1, a1d1
+_BK_KING_TO, _BK_ROOK_FROM, _BK_ROOK_TO = 6, 7, 5     # Black O-O:   e8g8, h8f8
+_BQ_KING_TO, _BQ_ROOK_FROM, _BQ_ROOK_TO = 2, 0, 3     # Black O-O-O: e8c8, a8d8
+
+# One shared tuple per piece, indexed like Board.bb (color * 6 + piece_type).
+# Pieces handed out by a board are always one of these, so equality checks
+# against a freshly built (Color, PieceType) tuple still work.
+PIECES: tuple[Piece, ...] = tuple((c, pt) for c in Color for pt in PieceType)
+
+# The mailbox holds a small int per square: 0 for empty, otherwise the
+# piece's Board.bb index + 1.  These decode a code back into its parts.
+EMPTY = 0
+CODE_PIECE: tuple[Optional[Piece], ...] = (None,) + PIECES
+CODE_COLOR: tuple[Optional[Color], ...] = (None,) + tuple(c for c, _ in PIECES)
+CODE_TYPE: tuple[Optional[PieceType], ...] = (None,) + tuple(pt for _, pt in PIECES)
+# Signed PIECE_VALUES by code: White pieces count up, Black pieces down
+_CODE_VALUE: tuple[int, ...] = (0,) + tuple(
+    PIECE_VALUES[pt] if c == Color.WHITE else -PIECE_VALUES[pt] for c, pt in PIECES
+)
+
+# Enum members read through the class cost an attribute lookup each; the
+# make/undo hot path compares against these module-level aliases instead
+_WHITE, _BLACK = Color.WHITE, Color.BLACK
+_PAWN, _KING = PieceType.PAWN, PieceType.KING
+
+# Undo-stack slots preallocated per board; covers any realistic game
+_HISTORY_SIZE = 512
+
 
 class Board:
     """
@@ -24,18 +65,123 @@ class Board:
 
     Squares are indexed 0-63: row 0 = rank 8 (black back rank), col 0 = a-file.
     square = row * 8 + col.
+
+    Pieces are held twice and kept in sync: as twelve bitboards in ``bb``
+    (bit *s* set ⇔ a piece of that kind stands on square *s*), and as a
+    64-entry ``mailbox`` of small-int piece codes (see ``CODE_PIECE``) for
+    O(1) ``piece_at`` lookups.  ``occ[color]`` is the union of that color's
+    bitboards.  ``squares`` is a list-like view over the mailbox that reads
+    and writes (Color, PieceType) tuples and keeps all of them in sync.
     """
 
     def __init__(self) -> None:
-        self.squares: list[Optional[Piece]] = [None] * 64
+        self.mailbox: list[int] = [EMPTY] * 64
+        # bb[color * 6 + piece_type] — one 64-bit int per piece kind
+        self.bb: list[int] = [0] * 12
+        # occ[color] — every square holding a piece of that color
+        self.occ: list[int] = [0, 0]
+        # XOR of the Zobrist keys of every piece on the board; see ``zobrist``
+        self.piece_hash: int = 0
+        # Sum of PIECE_VALUES on the board, White minus Black
+        self.material: int = 0
         self.turn: Color = Color.WHITE
-        # K = white kingside, Q = white queenside, k = black kingside, q = black queenside
-        self.castling_rights: dict[str, bool] = {'K': True, 'Q': True, 'k': True, 'q': True}
+        # Castling rights as CR_* bits (CR_WK | CR_WQ | CR_BK | CR_BQ)
+        self.castling: int = CR_ALL
         self.ep_square: Optional[int] = None
         self.halfmove_clock: int = 0
         self.fullmove_number: int = 1
-        # Undo stack: each entry is a dict with enough info to restore
-        self._history: list[dict] = []
+        # Undo stack: each entry is a flat tuple
+        # (move, captured code, ep capture square or None, castling,
+        #  ep_square, halfmove_clock, fullmove_number, piece_hash, material)
+        # Preallocated; entries below _history_top are live and the slots
+        # above it are reused, growing the list only past _HISTORY_SIZE plies.
+        self._history: list[Optional[tuple]] = [None] * _HISTORY_SIZE
+        self._history_top: int = 0
+
+    # ------------------------------------------------------------------
+    # Zobrist hash
+    # ------------------------------------------------------------------
+
+    @property
+    def zobrist(self) -> int:
+        """
+        Zobrist hash of the position, equal to ``ZobristHasher().hash_board``.
+
+        The piece keys are kept up to date move by move in ``piece_hash``;
+        side to move, castling rights and en passant are folded in here with
+        three table lookups, so those fields can still be assigned directly.
+        """
+        h = self.piece_hash ^ CASTLING_KEYS[self.castling]
+        if self.turn == _BLACK:
+            h ^= BLACK_TO_MOVE_KEY
+        if self.ep_square is not None:
+            h ^= EP_FILE_KEYS[self.ep_square & 7]
+        return h
+
+    # ------------------------------------------------------------------
+    # Castling rights
+    # ------------------------------------------------------------------
+
+    @property
+    def castling_rights(self) -> dict[str, bool]:
+        """Castling rights keyed 'K', 'Q', 'k', 'q' (a snapshot of ``castling``)."""
+        return {key: bool(self.castling & flag) for key, flag in CASTLING_FLAGS.items()}
+
+    @castling_rights.setter
+    def castling_rights(self, rights: Mapping[str, bool]) -> None:
+        self.castling = 0
+        for key, flag in CASTLING_FLAGS.items():
+            if rights.get(key):
+                self.castling |= flag
+
+    # ------------------------------------------------------------------
+    # Piece placement
+    # ------------------------------------------------------------------
+
+    @property
+    def squares(self) -> '_SquareView':
+        return _SquareView(self)
+
+    @squares.setter
+    def squares(self, pieces: Iterable[Optional[Piece]]) -> None:
+        self.mailbox = [EMPTY] * 64
+        self.bb = [0] * 12
+        self.occ = [0, 0]
+        self.piece_hash = 0
+        self.material = 0
+        for s, piece in enumerate(pieces):
+            if piece is not None:
+                self.put_piece(s, piece)
+
+    def put_piece(self, square: int, piece: Optional[Piece]) -> None:
+        """Place *piece* on *square* (None clears it), replacing any occupant."""
+        old = self.mailbox[square]
+        if old:
+            old_idx = old - 1
+            self.bb[old_idx] &= ~(1 << square)
+            self.occ[CODE_COLOR[old]] &= ~(1 << square)
+            self.piece_hash ^= PIECE_KEYS[old_idx * 64 + square]
+            self.material -= _CODE_VALUE[old]
+        if piece is None:
+            self.mailbox[square] = EMPTY
+            return
+        idx = piece[0] * 6 + piece[1]
+        self.mailbox[square] = idx + 1
+        self.bb[idx] |= 1 << square
+        self.occ[piece[0]] |= 1 << square
+        self.piece_hash ^= PIECE_KEYS[idx * 64 + square]
+        self.material += _CODE_VALUE[idx + 1]
+
+    def _shift_piece(self, from_sq: int, to_sq: int) -> None:
+        """Move whatever stands on *from_sq* to the empty *to_sq*."""
+        code = self.mailbox[from_sq]
+        self.mailbox[to_sq] = code
+        self.mailbox[from_sq] = EMPTY
+        move_bits = (1 << from_sq) | (1 << to_sq)
+        idx = code - 1
+        self.bb[idx] ^= move_bits
+        self.occ[CODE_COLOR[code]] ^= move_bits
+        self.piece_hash ^= PIECE_KEYS[idx * 64 + from_sq] ^ PIECE_KEYS[idx * 64 + to_sq]
 
     # ------------------------------------------------------------------
     # Setup
@@ -45,27 +191,24 @@ class Board:
         """Place pieces in the standard starting position."""
         self.squares = [None] * 64
         self.turn = Color.WHITE
-        self.castling_rights = {'K': True, 'Q': True, 'k': True, 'q': True}
+        self.castling = CR_ALL
         self.ep_square = None
         self.halfmove_clock = 0
         self.fullmove_number = 1
-        self._history = []
+        self._history_top = 0
 
         for col, pt in enumerate(_BACK_RANK):
-            self.squares[sq(0, col)] = (Color.BLACK, pt)
-        for col in range(8):
-            self.squares[sq(1, col)] = (Color.BLACK, PieceType.PAWN)
-        for col in range(8):
-            self.squares[sq(6, col)] = (Color.WHITE, PieceType.PAWN)
-        for col, pt in enumerate(_BACK_RANK):
-            self.squares[sq(7, col)] = (Color.WHITE, pt)
+            self.put_piece(col, (Color.BLACK, pt))                   # rank 8
+            self.put_piece(8 + col, (Color.BLACK, PieceType.PAWN))   # rank 7
+            self.put_piece(48 + col, (Color.WHITE, PieceType.PAWN))  # rank 2
+            self.put_piece(56 + col, (Color.WHITE, pt))              # rank 1
 
     # ------------------------------------------------------------------
     # Queries
     # ------------------------------------------------------------------
 
     def piece_at(self, square: int) -> Optional[Piece]:
-        return self.squares[square]
+        return CODE_PIECE[self.mailbox[square]]
 
     # ------------------------------------------------------------------
     # Make / Undo
@@ -73,163 +216,298 @@ class Board:
 
     def make_move(self, move: Move) -> None:
         """Execute a move (assumed pseudo-legal or legal) and push undo info."""
-        piece = self.squares[move.from_sq]
-        assert piece is not None, f'No piece at {move.from_sq}'
-        color, piece_type = piece
-
-        undo: dict = {
-            'move': move,
-            'captured': self.squares[move.to_sq],
-            'ep_captured': None,
-            'castling_rights': self.castling_rights.copy(),
-            'ep_square': self.ep_square,
-            'halfmove_clock': self.halfmove_clock,
-            'fullmove_number': self.fullmove_number,
-        }
+        # Hot path: every search node calls this, so attributes are read into
+        # locals once and board fields are written back once.
+        from_sq = move & 63
+        to_sq = move >> TO_SHIFT & 63
+        promo = move >> PROMO_SHIFT & 7  # promotion piece type + 1, or 0
+        mailbox = self.mailbox
+        bb = self.bb
+        occ = self.occ
+        code = mailbox[from_sq]
+        assert code, f'No piece at {from_sq}'
+        idx = code - 1
+        color, piece_type = CODE_PIECE[code]
+        to_bit = 1 << to_sq
+        piece_hash = self.piece_hash
+        material = self.material
+
+        captured = mailbox[to_sq]
+        if captured:
+            cap_idx = captured - 1
+            bb[cap_idx] ^= to_bit
+            occ[color ^ 1] ^= to_bit
+            piece_hash ^= PIECE_KEYS[cap_idx * 64 + to_sq]
+            material -= _CODE_VALUE[captured]
 
         # En passant capture: remove the captured pawn
-        if move.is_en_passant:
-            ep_cap_row = move.to_sq // 8 + (1 if color == Color.WHITE else -1)
-            ep_cap_sq = ep_cap_row * 8 + move.to_sq % 8
-            undo['ep_captured'] = (ep_cap_sq, self.squares[ep_cap_sq])
-            self.squares[ep_cap_sq] = None
-
-        # Move the piece
-        self.squares[move.to_sq] = piece
-        self.squares[move.from_sq] = None
-
-        # Promotion
-        if move.promotion is not None:
-            self.squares[move.to_sq] = (color, move.promotion)
+        ep_cap_sq = None
+        if move & EP_FLAG:
+            ep_cap_sq = to_sq + 8 if color == _WHITE else to_sq - 8
+            ep_idx = mailbox[ep_cap_sq] - 1
+            mailbox[ep_cap_sq] = EMPTY
+            bb[ep_idx] ^= 1 << ep_cap_sq
+            occ[color ^ 1] ^= 1 << ep_cap_sq
+            piece_hash ^= PIECE_KEYS[ep_idx * 64 + ep_cap_sq]
+            material -= _CODE_VALUE[ep_idx + 1]
+
+        castling = self.castling
+        halfmove_clock = self.halfmove_clock
+        undo = (
+            move, captured, ep_cap_sq,
+            castling, self.ep_square, halfmove_clock, self.fullmove_number,
+            self.piece_hash, self.material,
+        )
+        top = self._history_top
+        try:
+            self._history[top] = undo
+        except IndexError:
+            self._history.append(undo)
+        self._history_top = top + 1
+
+        # Move the piece (promotion swaps in the new piece type)
+        mailbox[from_sq] = EMPTY
+        occ[color] ^= (1 << from_sq) | to_bit
+        if not promo:
+            mailbox[to_sq] = code
+            bb[idx] ^= (1 << from_sq) | to_bit
+            piece_hash ^= PIECE_KEYS[idx * 64 + from_sq] ^ PIECE_KEYS[idx * 64 + to_sq]
+        else:
+            promo_idx = color * 6 + promo - 1
+            mailbox[to_sq] = promo_idx + 1
+            bb[idx] ^= 1 << from_sq
+            bb[promo_idx] |= to_bit
+            piece_hash ^= PIECE_KEYS[idx * 64 + from_sq] ^ PIECE_KEYS[promo_idx * 64 + to_sq]
+            material += _CODE_VALUE[promo_idx + 1] - _CODE_VALUE[code]
+        self.material = material
+        # Written back before the rook shift below, which updates it in place
+        self.piece_hash = piece_hash
 
         # Castling: also move the rook
-        if move.is_castle:
-            if move.to_sq == sq(7, 6):   # White kingside
-                self.squares[sq(7, 5)] = self.squares[sq(7, 7)]
-                self.squares[sq(7, 7)] = None
-            elif move.to_sq == sq(7, 2): # White queenside
-                self.squares[sq(7, 3)] = self.squares[sq(7, 0)]
-                self.squares[sq(7, 0)] = None
-            elif move.to_sq == sq(0, 6): # Black kingside
-                self.squares[sq(0, 5)] = self.squares[sq(0, 7)]
-                self.squares[sq(0, 7)] = None
-            elif move.to_sq == sq(0, 2): # Black queenside
-                self.squares[sq(0, 3)] = self.squares[sq(0, 0)]
-                self.squares[sq(0, 0)] = None
-
-        # Update en passant square
-        self.ep_square = None
-        if piece_type == PieceType.PAWN:
-            from_row = move.from_sq // 8
-            to_row = move.to_sq // 8
-            if abs(to_row - from_row) == 2:
-                self.ep_square = ((from_row + to_row) // 2) * 8 + (move.from_sq % 8)
-
-        # Update castling rights
-        if piece_type == PieceType.KING:
-            if color == Color.WHITE:
-                self.castling_rights['K'] = False
-                self.castling_rights['Q'] = False
-            else:
-                self.castling_rights['k'] = False
-                self.castling_rights['q'] = False
-
-        if piece_type == PieceType.ROOK:
-            _rook_castling_update(self.castling_rights, move.from_sq)
-
-        # A rook being captured also loses castling rights
-        if undo['captured'] is not None:
-            _rook_castling_update(self.castling_rights, move.to_sq)
-
-        # Halfmove clock
-        if piece_type == PieceType.PAWN or undo['captured'] is not None or move.is_en_passant:
+        if move & CASTLE_FLAG:
+            if to_sq == _WK_KING_TO:
+                self._shift_piece(_WK_ROOK_FROM, _WK_ROOK_TO)
+            elif to_sq == _WQ_KING_TO:
+                self._shift_piece(_WQ_ROOK_FROM, _WQ_ROOK_TO)
+            elif to_sq == _BK_KING_TO:
+                self._shift_piece(_BK_ROOK_FROM, _BK_ROOK_TO)
+            elif to_sq == _BQ_KING_TO:
+                self._shift_piece(_BQ_ROOK_FROM, _BQ_ROOK_TO)
+
+        # En passant square and halfmove clock
+        if piece_type == _PAWN:
+            # A double push leaves the square it skipped open to en passant
+            diff = to_sq - from_sq
+            self.ep_square = from_sq + diff // 2 if diff == 16 or diff == -16 else None
             self.halfmove_clock = 0
         else:
-            self.halfmove_clock += 1
+            self.ep_square = None
+            self.halfmove_clock = 0 if captured else halfmove_clock + 1
 
-        # Fullmove number
-        if color == Color.BLACK:
-            self.fullmove_number += 1
-
-        # Switch turn
-        self.turn = Color.BLACK if color == Color.WHITE else Color.WHITE
+        # A king or rook leaving its home square, or a rook captured there,
+        # loses the matching rights
+        self.castling = castling & _CR_CLEAR[from_sq] & _CR_CLEAR[to_sq]
 
-        self._history.append(undo)
+        # Fullmove number and side to move
+        if color == _BLACK:
+            self.fullmove_number += 1
+            self.turn = _WHITE
+        else:
+            self.turn = _BLACK
 
     def undo_move(self) -> None:
         """Restore the board to the state before the last make_move call."""
-        if not self._history:
+        top = self._history_top
+        if not top:
             return
-        undo = self._history.pop()
-        move = undo['move']
+        self._history_top = top = top - 1
+        (move, captured, ep_cap_sq,
+         self.castling, self.ep_square, self.halfmove_clock, self.fullmove_number,
+         piece_hash, self.material) = self._history[top]
+        from_sq = move & 63
+        to_sq = move >> TO_SHIFT & 63
+        mailbox = self.mailbox
+        bb = self.bb
+        occ = self.occ
 
         # Switch turn back
-        self.turn = Color.BLACK if self.turn == Color.WHITE else Color.WHITE
-        color = self.turn
+        color = self.turn = _BLACK if self.turn == _WHITE else _WHITE
+        to_bit = 1 << to_sq
+        occ[color] ^= (1 << from_sq) | to_bit
 
         # Restore the moving piece (un-promote if needed)
-        piece_at_dest = self.squares[move.to_sq]
-        moving_piece: Piece = (color, PieceType.PAWN) if move.promotion else piece_at_dest  # type: ignore[assignment]
+        code = mailbox[to_sq]
+        if not move >> PROMO_SHIFT & 7:
+            mailbox[from_sq] = code
+            bb[code - 1] ^= (1 << from_sq) | to_bit
+        else:
+            pawn_idx = color * 6 + _PAWN
+            mailbox[from_sq] = pawn_idx + 1
+            bb[code - 1] ^= to_bit
+            bb[pawn_idx] |= 1 << from_sq
 
-        self.squares[move.from_sq] = moving_piece
-        self.squares[move.to_sq] = undo['captured']
+        mailbox[to_sq] = captured
+        if captured:
+            bb[captured - 1] |= to_bit
+            occ[color ^ 1] |= to_bit
 
         # Restore en-passant captured pawn
-        if move.is_en_passant and undo['ep_captured']:
-            ep_sq, ep_piece = undo['ep_captured']
-            self.squares[ep_sq] = ep_piece
+        if ep_cap_sq is not None:
+            pawn_idx = (color ^ 1) * 6 + _PAWN
+            mailbox[ep_cap_sq] = pawn_idx + 1
+            bb[pawn_idx] |= 1 << ep_cap_sq
+            occ[color ^ 1] |= 1 << ep_cap_sq
 
         # Restore rook if castling
-        if move.is_castle:
-            if move.to_sq == sq(7, 6):
-                self.squares[sq(7, 7)] = self.squares[sq(7, 5)]
-                self.squares[sq(7, 5)] = None
-            elif move.to_sq == sq(7, 2):
-                self.squares[sq(7, 0)] = self.squares[sq(7, 3)]
-                self.squares[sq(7, 3)] = None
-            elif move.to_sq == sq(0, 6):
-                self.squares[sq(0, 7)] = self.squares[sq(0, 5)]
-                self.squares[sq(0, 5)] = None
-            elif move.to_sq == sq(0, 2):
-                self.squares[sq(0, 0)] = self.squares[sq(0, 3)]
-                self.squares[sq(0, 3)] = None
-
-        # Restore game state fields
-        self.castling_rights = undo['castling_rights']
-        self.ep_square = undo['ep_square']
-        self.halfmove_clock = undo['halfmove_clock']
-        self.fullmove_number = undo['fullmove_number']
+        if move & CASTLE_FLAG:
+            if to_sq == _WK_KING_TO:
+                self._shift_piece(_WK_ROOK_TO, _WK_ROOK_FROM)
+            elif to_sq == _WQ_KING_TO:
+                self._shift_piece(_WQ_ROOK_TO, _WQ_ROOK_FROM)
+            elif to_sq == _BK_KING_TO:
+                self._shift_piece(_BK_ROOK_TO, _BK_ROOK_FROM)
+            elif to_sq == _BQ_KING_TO:
+                self._shift_piece(_BQ_ROOK_TO, _BQ_ROOK_FROM)
+
+        # Restored last: the rook shift above also updates it
+        self.piece_hash = piece_hash
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
     def find_king(self, color: Color) -> Optional[int]:
-        for s in range(64):
-            p = self.squares[s]
-            if p and p[0] == color and p[1] == PieceType.KING:
-                return s
-        return None
+        kings = self.bb[color * 6 + _KING]
+        if not kings:
+            return None
+        return (kings & -kings).bit_length() - 1
 
     def copy(self) -> 'Board':
         b = Board()
-        b.squares = self.squares[:]
+        b.mailbox = self.mailbox[:]
+        b.bb = self.bb[:]
+        b.occ = self.occ[:]
+        b.piece_hash = self.piece_hash
+        b.material = self.material
         b.turn = self.turn
-        b.castling_rights = self.castling_rights.copy()
+        b.castling = self.castling
         b.ep_square = self.ep_square
         b.halfmove_clock = self.halfmove_clock
         b.fullmove_number = self.fullmove_number
         # Don't copy history — the copy is used for read-only queries
         return b
 
+    def snapshot(self) -> 'BoardSnapshot':
+        """A frozen, read-only copy of the current position for pickling."""
+        return BoardSnapshot(self)
+
+
+class BoardSnapshot:
+    """
+    Read-only copy of a Board's position, without its undo history.
+
+    The ``mailbox``, ``bb`` and ``occ`` lists are copied when the snapshot
+    is taken (76 ints, far cheaper than any search), so the board may keep
+    changing while the snapshot waits to be pickled, e.g. on a process
+    pool's queue feeder thread.  ``copy()`` turns it into an independent
+    Board, and pickling it produces one.
+    """
+
+    __slots__ = (
+        'mailbox', 'bb', 'occ', 'piece_hash', 'material', 'turn', 'castling',
+        'ep_square', 'halfmove_clock', 'fullmove_number',
+    )
+
+    def __init__(self, board: Board) -> None:
+        self.mailbox = board.mailbox[:]
+        self.bb = board.bb[:]
+        self.occ = board.occ[:]
+        self.piece_hash = board.piece_hash
+        self.material = board.material
+        self.turn = board.turn
+        self.castling = board.castling
+        self.ep_square = board.ep_square
+        self.halfmove_clock = board.halfmove_clock
+        self.fullmove_number = board.fullmove_number
+
+    zobrist = property(Board.zobrist.fget)
+    castling_rights = property(Board.castling_rights.fget)
+    piece_at = Board.piece_at
+    find_king = Board.find_king
+    copy = Board.copy
+
+    def __reduce__(self):
+        return _restore_board, (
+            self.mailbox, self.bb, self.turn, self.castling, self.ep_square,
+            self.halfmove_clock, self.fullmove_number,
+        )
+
+
+def _restore_board(
+    mailbox: list[int],
+    bb: list[int],
+    turn: Color,
+    castling: int,
+    ep_square: Optional[int],
+    halfmove_clock: int,
+    fullmove_number: int,
+) -> Board:
+    """Unpickle a BoardSnapshot as a Board, rebuilding the derived fields."""
+    b = Board()
+    b.mailbox = mailbox
+    b.bb = bb
+    b.occ = [
+        bb[0] | bb[1] | bb[2] | bb[3] | bb[4] | bb[5],
+        bb[6] | bb[7] | bb[8] | bb[9] | bb[10] | bb[11],
+    ]
+    b.piece_hash = 0
+    b.material = 0
+    for s, code in enumerate(mailbox):
+        if code:
+            b.piece_hash ^= PIECE_KEYS[(code - 1) * 64 + s]
+            b.material += _CODE_VALUE[code]
+    b.turn = turn
+    b.castling = castling
+    b.ep_square = ep_square
+    b.halfmove_clock = halfmove_clock
+    b.fullmove_number = fullmove_number
+    return b
+
+
+class _SquareView:
+    """
+    List-like access to ``Board.mailbox`` in (Color, PieceType) tuples.
+
+    Reads decode the mailbox code; writes go through ``Board.put_piece``
+    so the bitboards never drift from the mailbox.
+    """
+
+    __slots__ = ('_board',)
+
+    def __init__(self, board: Board) -> None:
+        self._board = board
+
+    def __getitem__(self, square: int) -> Optional[Piece]:
+        return CODE_PIECE[self._board.mailbox[square]]
+
+    def __setitem__(self, square: int, piece: Optional[Piece]) -> None:
+        self._board.put_piece(square, piece)
+
+    def __iter__(self) -> Iterator[Optional[Piece]]:
+        return map(CODE_PIECE.__getitem__, self._board.mailbox)
+
+    def __len__(self) -> int:
+        return 64
+
 
-def _rook_castling_update(rights: dict[str, bool], square: int) -> None:
-    """Remove castling right when a rook moves from or is captured on its home square."""
-    if square == sq(7, 7):
-        rights['K'] = False
-    elif square == sq(7, 0):
-        rights['Q'] = False
-    elif square == sq(0, 7):
-        rights['k'] = False
-    elif square == sq(0, 0):
-        rights['q'] = False
+# Mask to AND into Board.castling for both squares of a move: clears both
+# of a side's rights on its king's home square, the matching right on the
+# four rook home squares, and is a no-op everywhere else.  Rights only
+# exist while king and rook are still home, so the squares say it all.
+_CR_CLEAR: list[int] = [CR_ALL] * 64
+_CR_CLEAR[60] = CR_ALL & ~(CR_WK | CR_WQ)  # e1
+_CR_CLEAR[4] = CR_ALL & ~(CR_BK | CR_BQ)   # e8
+_CR_CLEAR[_WK_ROOK_FROM] = CR_ALL & ~CR_WK
+_CR_CLEAR[_WQ_ROOK_FROM] = CR_ALL & ~CR_WQ
+_CR_CLEAR[_BK_ROOK_FROM] = CR_ALL & ~CR_BK
+_CR_CLEAR[_BQ_ROOK_FROM] = CR_ALL & ~CR_BQ
@@ -24,6 +24,15 @@ PIECE_VALUES = {
     PieceType.KING: 20000,
 }
 
+# Castling-rights bits, packed into Board.castling
+CR_WK = 1  # White kingside  ('K')
+CR_WQ = 2  # White queenside ('Q')
+CR_BK = 4  # Black kingside  ('k')
+CR_BQ = 8  # Black queenside ('q')
+CR_ALL = CR_WK | CR_WQ | CR_BK | CR_BQ
+
+CASTLING_FLAGS = {'K': CR_WK, 'Q': CR_WQ, 'k': CR_BK, 'q': CR_BQ}
+
 PIECE_LETTERS = {
     PieceType.PAWN: 'p',
     PieceType.KNIGHT: 'n',
@@ -44,14 +53,19 @@ def row_col(square: int) -> tuple[int, int]:
     return square // 8, square % 8
 
 
+# Algebraic names by square index, and back; built once so the UCI
+# conversions below are single lookups rather than row/col arithmetic
+_SQUARE_NAMES: tuple[str, ...] = tuple(
+    chr(ord('a') + col) + str(8 - row) for row in range(8) for col in range(8)
+)
+_SQUARE_INDEX: dict[str, int] = {name: s for s, name in enumerate(_SQUARE_NAMES)}
+
+
 def square_name(square: int) -> str:
     """Convert square index to algebraic notation (e.g. 0 -> a8, 63 -> h1)."""
-    row, col = row_col(square)
-    return chr(ord('a') + col) + str(8 - row)
+    return _SQUARE_NAMES[square]
 
 
 def square_from_name(name: str) -> int:
     """Convert algebraic notation to square index (e.g. 'e4' -> 36)."""
-    col = ord(name[0]) - ord('a')
-    row = 8 - int(name[1])
-    return sq(row, col)
+    return _SQUARE_INDEX[name]
@@ -1,11 +1,17 @@
 """High-level GameState wrapping Board + history + result detection."""
-from typing import Optional
+from typing import Iterable, Optional
 
 from engine.board import Board
 from engine.constants import Color, PieceType
-from engine.move import Move
+from engine.move import PROMO_SHIFT, TO_SHIFT, Move
 from engine.move_generator import generate_legal_moves, is_in_check
-from engine.zobrist import ZobristHasher
+
+
+# (from_sq, to_sq, promotion) — identifies a move without its special-move flags
+MoveKey = tuple[int, int, Optional[PieceType]]
+
+# Squares with (row + col) even, a8 among them
+_LIGHT_SQUARES = sum(1 << s for s in range(64) if (s // 8 + s % 8) % 2 == 0)
 
 
 class GameResult:
@@ -28,21 +34,49 @@ class GameState:
 
     Call make_move() to advance the game.  Legal moves are cached and
     invalidated whenever the board changes.
+
+    With no *board* the game starts from the standard position; otherwise
+    it continues from the given board (treated as having no prior moves).
     """
 
-    def __init__(self) -> None:
-        self.board = Board()
-        self.board.setup_start_position()
-        self._hasher = ZobristHasher()
+    def __init__(self, board: Optional[Board] = None) -> None:
+        from_start = board is None
+        if board is None:
+            board = Board()
+            board.setup_start_position()
+        self.board = board
         self._position_counts: dict[int, int] = {}
         self._move_history: list[Move] = []
         self._cached_legal: Optional[list[Move]] = None
+        self._legal_by_key: Optional[dict[MoveKey, Move]] = None
 
         self.result: str = GameResult.ONGOING
         self.draw_reason: Optional[str] = None
         self.resignation: Optional[Color] = None
 
         self._record_position()
+        if not from_start:
+            self._update_result()
+
+    @classmethod
+    def from_pieces(
+        cls,
+        white: Iterable[tuple[int, PieceType]],
+        black: Iterable[tuple[int, PieceType]],
+        turn: Color = Color.WHITE,
+    ) -> 'GameState':
+        """
+        Start a game from only the given (square, piece type) pairs, with no
+        castling rights and no en-passant square.
+        """
+        board = Board()
+        for s, pt in white:
+            board.put_piece(s, (Color.WHITE, pt))
+        for s, pt in black:
+            board.put_piece(s, (Color.BLACK, pt))
+        board.turn = turn
+        board.castling = 0
+        return cls(board)
 
     # ------------------------------------------------------------------
     # Properties
@@ -54,6 +88,18 @@ class GameState:
             self._cached_legal = generate_legal_moves(self.board)
         return self._cached_legal
 
+    @property
+    def legal_moves_by_key(self) -> dict[MoveKey, Move]:
+        """Legal moves indexed by (from_sq, to_sq, promotion)."""
+        if self._legal_by_key is None:
+            # Built once per position, so the keys are decoded straight from
+            # the packed int; only promotions go through the property
+            self._legal_by_key = {
+                (m & 63, m >> TO_SHIFT & 63, m.promotion if m >> PROMO_SHIFT & 7 else None): m
+                for m in self.legal_moves
+            }
+        return self._legal_by_key
+
     @property
     def is_in_check(self) -> bool:
         return is_in_check(self.board, self.board.turn)
@@ -70,15 +116,20 @@ class GameState:
         """
         Attempt to make *move*.  Returns True on success, False if illegal
         or the game is already over.
+
+        *move* is matched on (from_sq, to_sq, promotion), so its castling and
+        en-passant flags need not be set; the generated legal move is played.
         """
         if self.result != GameResult.ONGOING:
             return False
-        if move not in self.legal_moves:
+        move = self.legal_moves_by_key.get((move.from_sq, move.to_sq, move.promotion))
+        if move is None:
             return False
 
         self.board.make_move(move)
         self._move_history.append(move)
         self._cached_legal = None
+        self._legal_by_key = None
         self._record_position()
         self._update_result()
         return True
@@ -115,7 +166,7 @@ class GameState:
             self.draw_reason = DrawReason.FIFTY_MOVE
             return
 
-        h = self._hasher.hash_board(self.board)
+        h = self.board.zobrist
         if self._position_counts.get(h, 0) >= 3:
             self.result = GameResult.DRAW
             self.draw_reason = DrawReason.THREEFOLD
@@ -126,21 +177,19 @@ class GameState:
             self.draw_reason = DrawReason.INSUFFICIENT
 
     def _is_insufficient_material(self) -> bool:
-        pieces = [(s, c, pt) for s in range(64) if (p := self.board.squares[s]) for c, pt in [p]]
-        if len(pieces) == 2:  # Only kings
+        # Piece counts come straight off the bitboards
+        bb = self.board.bb
+        total = (self.board.occ[0] | self.board.occ[1]).bit_count()
+        if total == 2:  # Only kings
             return True
-        if len(pieces) == 3:  # K+B vs K or K+N vs K
-            for _, _, pt in pieces:
-                if pt in (PieceType.BISHOP, PieceType.KNIGHT):
-                    return True
-        if len(pieces) == 4:  # K+B vs K+B same color squares
-            bishops = [(s, c) for s, c, pt in pieces if pt == PieceType.BISHOP]
-            if len(bishops) == 2:
-                s1, c1 = bishops[0]
-                s2, c2 = bishops[1]
-                if c1 != c2:  # Opposite colors own the bishops
-                    if (s1 // 8 + s1 % 8) % 2 == (s2 // 8 + s2 % 8) % 2:
-                        return True
+        if total == 3:  # K+B vs K or K+N vs K
+            return bool(bb[PieceType.KNIGHT] | bb[PieceType.BISHOP]
+                        | bb[6 + PieceType.KNIGHT] | bb[6 + PieceType.BISHOP])
+        if total == 4:  # K+B vs K+B same color squares
+            white_bishops = bb[PieceType.BISHOP]
+            black_bishops = bb[6 + PieceType.BISHOP]
+            if white_bishops.bit_count() == 1 and black_bishops.bit_count() == 1:
+                return bool(white_bishops & _LIGHT_SQUARES) == bool(black_bishops & _LIGHT_SQUARES)
         return False
 
     # ------------------------------------------------------------------
@@ -148,17 +197,9 @@ class GameState:
     # ------------------------------------------------------------------
 
     def _record_position(self) -> None:
-        h = self._hasher.hash_board(self.board)
+        h = self.board.zobrist
         self._position_counts[h] = self._position_counts.get(h, 0) + 1
 
-    def _unrecord_position(self) -> None:
-        h = self._hasher.hash_board(self.board)
-        count = self._position_counts.get(h, 0)
-        if count <= 1:
-            self._position_counts.pop(h, None)
-        else:
-            self._position_counts[h] = count - 1
-
     # ------------------------------------------------------------------
     # Serialisation
     # ------------------------------------------------------------------
@@ -166,7 +207,7 @@ class GameState:
     def to_dict(self) -> dict:
         board_array = []
         for s in range(64):
-            piece = self.board.squares[s]
+            piece = self.board.piece_at(s)
             if piece is not None:
                 color, pt = piece
                 board_array.append({
@@ -1,4 +1,3 @@
-from dataclasses import dataclass
 from typing import Optional
 
 from engine.constants import PieceType, square_name, square_from_name
@@ -11,23 +10,89 @@ _PROMO_LETTER = {
 }
 _LETTER_PROMO = {v: k for k, v in _PROMO_LETTER.items()}
 
+# Packed layout (17 bits):
+#   bits 0-5   from_sq
+#   bits 6-11  to_sq
+#   bits 12-14 promotion piece type + 1 (0 = no promotion)
+#   bit  15    castling
+#   bit  16    en passant
+# Hot paths decode with these directly instead of the properties below.
+TO_SHIFT = 6
+PROMO_SHIFT = 12
+CASTLE_FLAG = 1 << 15
+EP_FLAG = 1 << 16
 
-@dataclass
-class Move:
-    from_sq: int
-    to_sq: int
-    promotion: Optional[PieceType] = None
-    is_castle: bool = False
-    is_en_passant: bool = False
+# Packed values below this carry no promotion or flag
+_PLAIN_COUNT = 1 << PROMO_SHIFT
+
+# Promotion field value -> PieceType (or None)
+_PROMO_TYPES: tuple[Optional[PieceType], ...] = (None,) + tuple(PieceType) + (None,)
+
+
+class Move(int):
+    """
+    A move packed into a single int.
+
+    Construct it like the record it replaces —
+    ``Move(from_sq, to_sq, promotion=None, is_castle=False, is_en_passant=False)``
+    — and read the fields back as attributes.  Being an int, equality and
+    hashing are single C-level int operations; note that the castling and
+    en-passant flags take part in both.
+    """
+
+    __slots__ = ()
+
+    def __new__(
+        cls,
+        from_sq: int,
+        to_sq: int,
+        promotion: Optional[PieceType] = None,
+        is_castle: bool = False,
+        is_en_passant: bool = False,
+    ) -> 'Move':
+        value = from_sq | to_sq << TO_SHIFT
+        if promotion is not None:
+            value |= (promotion + 1) << PROMO_SHIFT
+        if is_castle:
+            value |= CASTLE_FLAG
+        if is_en_passant:
+            value |= EP_FLAG
+        if value < _PLAIN_COUNT and cls is Move:
+            return PLAIN_MOVES[value]
+        return int.__new__(cls, value)
+
+    @property
+    def from_sq(self) -> int:
+        return self & 63
+
+    @property
+    def to_sq(self) -> int:
+        return self >> TO_SHIFT & 63
+
+    @property
+    def promotion(self) -> Optional[PieceType]:
+        return _PROMO_TYPES[self >> PROMO_SHIFT & 7]
+
+    @property
+    def is_castle(self) -> bool:
+        return bool(self & CASTLE_FLAG)
+
+    @property
+    def is_en_passant(self) -> bool:
+        return bool(self & EP_FLAG)
 
     def uci(self) -> str:
-        s = square_name(self.from_sq) + square_name(self.to_sq)
-        if self.promotion is not None:
-            s += _PROMO_LETTER.get(self.promotion, '')
+        s = square_name(self & 63) + square_name(self >> TO_SHIFT & 63)
+        promotion = self.promotion
+        if promotion is not None:
+            s += _PROMO_LETTER.get(promotion, '')
         return s
 
     @staticmethod
     def from_uci(uci: str) -> 'Move':
+        move = _UCI_MOVES.get(uci)
+        if move is not None:
+            return move
         from_sq = square_from_name(uci[:2])
         to_sq = square_from_name(uci[2:4])
         promotion = None
@@ -35,17 +100,21 @@ class Move:
             promotion = _LETTER_PROMO.get(uci[4])
         return Move(from_sq, to_sq, promotion)
 
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, Move):
-            return False
-        return (
-            self.from_sq == other.from_sq
-            and self.to_sq == other.to_sq
-            and self.promotion == other.promotion
-        )
-
-    def __hash__(self) -> int:
-        return hash((self.from_sq, self.to_sq, self.promotion))
+    def __getnewargs__(self) -> tuple:
+        # Pickle through the constructor rather than the raw int value
+        return (self.from_sq, self.to_sq, self.promotion, self.is_castle, self.is_en_passant)
 
     def __repr__(self) -> str:
         return f'Move({self.uci()})'
+
+    __str__ = __repr__
+
+
+# One shared instance of every move without a promotion or flag, indexed by
+# its packed value (from_sq | to_sq << TO_SHIFT).  Move() hands these out,
+# and move generation picks from the table instead of allocating.
+PLAIN_MOVES: tuple[Move, ...] = tuple(int.__new__(Move, value) for value in range(_PLAIN_COUNT))
+
+# UCI string -> plain move, so parsing one is a single dict lookup;
+# promotions and malformed strings fall through to the field-by-field parse
+_UCI_MOVES: dict[str, Move] = {move.uci(): move for move in PLAIN_MOVES}
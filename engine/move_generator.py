@@ -1,38 +1,181 @@
 """Legal move generation for a chess Board."""
-from typing import TYPE_CHECKING
-
-from engine.constants import Color, PieceType, sq, row_col
-from engine.move import Move
+from typing import TYPE_CHECKING, Optional
+
+from engine.attacks import (
+    BB_ALL,
+    BETWEEN,
+    FILE_A,
+    FILE_H,
+    KING_ATTACKS,
+    KNIGHT_ATTACKS,
+    LINE,
+    PAWN_ATTACKS,
+    BISHOP_MASKS,
+    BISHOP_TABLES,
+    ROOK_MASKS,
+    ROOK_TABLES,
+    bishop_attacks,
+    rook_attacks,
+)
+from engine.constants import CR_BK, CR_BQ, CR_WK, CR_WQ, Color, PieceType, sq
+from engine.move import CASTLE_FLAG, EP_FLAG, PLAIN_MOVES, PROMO_SHIFT, TO_SHIFT, Move
 
 if TYPE_CHECKING:
     from engine.board import Board
 
+# Reading a member off an enum class costs ~100ns per access on 3.11,
+# a module global a few ns; the generation paths use these instead
+_WHITE = Color.WHITE
+_PAWN, _KNIGHT, _BISHOP = PieceType.PAWN, PieceType.KNIGHT, PieceType.BISHOP
+_ROOK, _QUEEN, _KING = PieceType.ROOK, PieceType.QUEEN, PieceType.KING
+
 
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
-def generate_legal_moves(board: 'Board') -> list[Move]:
-    """Return all legal moves for the side whose turn it is."""
+# Generated move lists, direct-mapped by Zobrist hash: slot
+# ``zobrist & _LEGAL_CACHE_MASK`` holds (zobrist, legal moves, number of
+# leading captures) for the last position that landed there.  The hash
+# covers everything legality depends on, so entries never go stale.
+LEGAL_CACHE_BITS = 14  # ~16 MB when every slot holds a full midgame list
+_LEGAL_CACHE_MASK = (1 << LEGAL_CACHE_BITS) - 1
+_legal_cache: list[Optional[tuple[int, list[Move], int]]] = [None] * (1 << LEGAL_CACHE_BITS)
+
+
+def generate_legal_moves(board: 'Board', captures: Optional[list[Move]] = None) -> list[Move]:
+    """
+    Return all legal moves for the side whose turn it is.
+
+    Pseudo-legal moves are filtered against the checkers and pinned pieces,
+    computed once per position, instead of playing each move out.  Only en
+    passant — which removes two pieces from a line — still uses make/undo.
+    Positions met again (transpositions, repetitions) are served from a
+    cache keyed by the Zobrist hash.
+
+    Moves onto an enemy piece come first.  If *captures* is given they are
+    moved into it instead, and the returned list holds only the rest.
+    """
+    key = board.zobrist
+    slot = key & _LEGAL_CACHE_MASK
+    entry = _legal_cache[slot]
+    if entry is None or entry[0] != key:
+        entry = _legal_cache[slot] = (key, *_generate_legal(board))
+    # Callers get copies; the cached list itself is never handed out
+    moves, n = entry[1], entry[2]
+    if captures is None:
+        return moves[:]
+    captures += moves[:n]
+    return moves[n:]
+
+
+def _generate_legal(board: 'Board') -> tuple[list[Move], int]:
+    """Return (legal moves, captures first, and how many of them capture)."""
     color = board.turn
-    pseudo = _pseudo_legal(board, color) + _castling_moves(board, color)
-    opponent = Color.BLACK if color == Color.WHITE else Color.WHITE
+    pseudo_captures, pseudo = _pseudo_legal(board, color)
+    pseudo += _castling_moves(board, color)
+    king_sq = board.find_king(color)
+    if king_sq is None:
+        return pseudo_captures + pseudo, len(pseudo_captures)
+    opponent = color ^ 1
+    checkers, pinned = _check_info(board, color, king_sq)
+
+    # Squares a non-king move must land on: anywhere, or — in check — on
+    # the checker or the line between it and the king.  Double check
+    # leaves only king moves.
+    if not checkers:
+        targets = BB_ALL
+    elif checkers & (checkers - 1):
+        targets = 0
+    else:
+        checker_sq = checkers.bit_length() - 1
+        targets = checkers | BETWEEN[king_sq][checker_sq]
+
+    occ_without_king = (board.occ[0] | board.occ[1]) ^ (1 << king_sq)
+    king_line = LINE[king_sq]
     legal: list[Move] = []
-    for move in pseudo:
-        board.make_move(move)
-        if not _is_attacked(board, board.find_king(color), opponent):  # type: ignore[arg-type]
+    for move in pseudo_captures + pseudo:
+        from_sq = move & 63
+        if from_sq == king_sq:
+            # The king itself must not step onto an attacked square; it is
+            # lifted off the board so it cannot hide behind itself
+            if not _is_attacked(board, move >> TO_SHIFT & 63, opponent, occ_without_king):
+                legal.append(move)
+        elif move & EP_FLAG:
+            board.make_move(move)
+            if not _is_attacked(board, king_sq, opponent):
+                legal.append(move)
+            board.undo_move()
+        else:
+            to_bit = 1 << (move >> TO_SHIFT & 63)
+            if not to_bit & targets:
+                continue
+            if pinned >> from_sq & 1 and not king_line[from_sq] & to_bit:
+                continue
             legal.append(move)
-        board.undo_move()
-    return legal
+    # Every capture comes ahead of every other move, so the legal ones are
+    # the moves landing on an enemy piece at the front of the list
+    enemies = board.occ[opponent]
+    n = 0
+    for move in legal:
+        if not enemies >> (move >> TO_SHIFT & 63) & 1:
+            break
+        n += 1
+    return legal, n
+
+
+def has_legal_move(board: 'Board') -> bool:
+    """
+    Return True if the side to move has at least one legal move.
+
+    Out of check, any move by an unpinned piece other than the king is
+    legal, so the first one found settles it without generating a list.
+    Positions where none turns up fall back to full generation.
+    """
+    color = board.turn
+    king_sq = board.find_king(color)
+    if king_sq is not None:
+        checkers, pinned = _check_info(board, color, king_sq)
+        if not checkers:
+            bb = board.bb
+            base = color * 6
+            own = board.occ[color]
+            occ = own | board.occ[color ^ 1]
+            free = ~pinned
+            pawns = bb[base] & free
+            if (pawns >> 8 if color == _WHITE else pawns << 8) & ~occ & BB_ALL:
+                return True
+            not_own = ~own
+            pieces = bb[base + 1] & free  # knights
+            while pieces:
+                low = pieces & -pieces
+                if KNIGHT_ATTACKS[low.bit_length() - 1] & not_own:
+                    return True
+                pieces ^= low
+            queens = bb[base + 4]
+            pieces = (bb[base + 2] | queens) & free  # diagonal sliders
+            while pieces:
+                low = pieces & -pieces
+                s = low.bit_length() - 1
+                if BISHOP_TABLES[s][occ & BISHOP_MASKS[s]] & not_own:
+                    return True
+                pieces ^= low
+            pieces = (bb[base + 3] | queens) & free  # orthogonal sliders
+            while pieces:
+                low = pieces & -pieces
+                s = low.bit_length() - 1
+                if ROOK_TABLES[s][occ & ROOK_MASKS[s]] & not_own:
+                    return True
+                pieces ^= low
+    return bool(generate_legal_moves(board))
 
 
 def is_in_check(board: 'Board', color: Color) -> bool:
     """Return True if *color*'s king is currently in check."""
-    king_sq = board.find_king(color)
-    if king_sq is None:
+    kings = board.bb[color * 6 + _KING]
+    if not kings:
         return False
-    opponent = Color.BLACK if color == Color.WHITE else Color.WHITE
-    return _is_attacked(board, king_sq, opponent)
+    return _is_attacked(board, (kings & -kings).bit_length() - 1, color ^ 1)
 
 
 def is_square_attacked(board: 'Board', square: int, by_color: Color) -> bool:
@@ -40,180 +183,255 @@ def is_square_attacked(board: 'Board', square: int, by_color: Color) -> bool:
     return _is_attacked(board, square, by_color)
 
 
-# ---------------------------------------------------------------------------
-# Pseudo-legal generation
-# ---------------------------------------------------------------------------
+def is_pseudo_legal(board: 'Board', move: Move) -> bool:
+    """
+    Return True if *move* is one the side to move could generate here,
+    ignoring whether it leaves the king in check.
 
-def _pseudo_legal(board: 'Board', color: Color) -> list[Move]:
-    moves: list[Move] = []
-    for s in range(64):
-        piece = board.squares[s]
-        if piece is None or piece[0] != color:
-            continue
-        pt = piece[1]
-        if pt == PieceType.PAWN:
-            moves.extend(_pawn_moves(board, s, color))
-        elif pt == PieceType.KNIGHT:
-            moves.extend(_knight_moves(board, s, color))
-        elif pt == PieceType.BISHOP:
-            moves.extend(_sliding(board, s, color, _DIAG))
-        elif pt == PieceType.ROOK:
-            moves.extend(_sliding(board, s, color, _ORTH))
-        elif pt == PieceType.QUEEN:
-            moves.extend(_sliding(board, s, color, _DIAG + _ORTH))
-        elif pt == PieceType.KING:
-            moves.extend(_king_moves(board, s, color))
-    return moves
+    A per-move check for moves that come from elsewhere (e.g. a
+    transposition-table entry), so they can be validated without
+    generating the whole move list.
+    """
+    color = board.turn
+    from_sq = move & 63
+    piece = board.piece_at(from_sq)
+    if piece is None or piece[0] != color:
+        return False
+    if move & CASTLE_FLAG:
+        return move in _castling_moves(board, color)
 
+    to_sq = move >> TO_SHIFT & 63
+    to_bit = 1 << to_sq
+    own = board.occ[color]
+    if own & to_bit:
+        return False
+    enemies = board.occ[color ^ 1]
+    promotion = move >> PROMO_SHIFT & 7
+    pt = piece[1]
+
+    if pt == _PAWN:
+        promo_rank = _RANK_8 if color == _WHITE else _RANK_1
+        if not (promotion - 1 in _PROMOTIONS if to_bit & promo_rank else promotion == 0):
+            return False
+        if move & EP_FLAG:
+            return to_sq == board.ep_square and bool(PAWN_ATTACKS[color][from_sq] & to_bit)
+        if PAWN_ATTACKS[color][from_sq] & to_bit:
+            return bool(enemies & to_bit)
+        occ = own | enemies
+        step = -8 if color == _WHITE else 8
+        if to_sq == from_sq + step:
+            return not occ & to_bit
+        start_rank = _RANK_2 if color == _WHITE else _RANK_7
+        return (to_sq == from_sq + 2 * step
+                and bool(start_rank >> from_sq & 1)
+                and not occ & (to_bit | 1 << (from_sq + step)))
+
+    if move & EP_FLAG or promotion:
+        return False
+    if pt == _KNIGHT:
+        attacks = KNIGHT_ATTACKS[from_sq]
+    elif pt == _KING:
+        attacks = KING_ATTACKS[from_sq]
+    else:
+        occ = own | enemies
+        attacks = 0
+        if pt != _BISHOP:
+            attacks |= rook_attacks(from_sq, occ)
+        if pt != _ROOK:
+            attacks |= bishop_attacks(from_sq, occ)
+    return bool(attacks & to_bit)
+
+
+def is_legal_move(board: 'Board', move: Move) -> bool:
+    """Return True if *move* is legal for the side to move."""
+    if not is_pseudo_legal(board, move):
+        return False
+    color = board.turn
+    board.make_move(move)
+    legal = not is_in_check(board, color)
+    board.undo_move()
+    return legal
 
-_DIAG = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
-_ORTH = [(1, 0), (-1, 0), (0, 1), (0, -1)]
-_KNIGHT_DELTAS = [(-2, -1), (-2, 1), (-1, -2), (-1, 2), (1, -2), (1, 2), (2, -1), (2, 1)]
-_KING_DELTAS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
 
+# ---------------------------------------------------------------------------
+# Pseudo-legal generation
+# ---------------------------------------------------------------------------
 
-def _pawn_moves(board: 'Board', s: int, color: Color) -> list[Move]:
-    moves: list[Move] = []
-    row, col = row_col(s)
-    direction = -1 if color == Color.WHITE else 1
-    start_row = 6 if color == Color.WHITE else 1
-    promo_row = 0 if color == Color.WHITE else 7
-
-    # Single push
-    nr = row + direction
-    if 0 <= nr <= 7:
-        fwd = sq(nr, col)
-        if board.squares[fwd] is None:
-            if nr == promo_row:
-                for pt in (PieceType.QUEEN, PieceType.ROOK, PieceType.BISHOP, PieceType.KNIGHT):
-                    moves.append(Move(s, fwd, promotion=pt))
+def _pseudo_legal(board: 'Board', color: Color) -> tuple[list[Move], list[Move]]:
+    """
+    Return (captures, quiet moves) for *color*, castling excepted.
+
+    A capture here is a move onto an enemy piece; en passant lands on an
+    empty square and counts as quiet.  Each list is in generation order.
+    """
+    captures: list[Move] = []
+    quiets: list[Move] = []
+    _pawn_moves(board, color, captures, quiets)
+
+    # Hot path: the other pieces are handled inline, with the tables bound
+    # to locals, rather than a helper call per piece.  Each attack set is a
+    # single table lookup, and each move is picked from PLAIN_MOVES rather
+    # than allocated.  Splitting the attack set into enemy and empty
+    # squares sorts captures from quiet moves without testing each move.
+    add_capture = captures.append
+    add_quiet = quiets.append
+    plain = PLAIN_MOVES
+    bb = board.bb
+    enemies = board.occ[color ^ 1]
+    occ = board.occ[color] | enemies
+    empty = ~occ
+    base = color * 6
+    rook_tables, rook_masks = ROOK_TABLES, ROOK_MASKS
+    bishop_tables, bishop_masks = BISHOP_TABLES, BISHOP_MASKS
+
+    for kind in range(1, 6):  # every piece type but the pawn
+        pieces = bb[base + kind]
+        while pieces:
+            low = pieces & -pieces
+            s = low.bit_length() - 1
+            pieces ^= low
+            if kind == 1:    # knight
+                attacks = KNIGHT_ATTACKS[s]
+            elif kind == 2:  # bishop
+                attacks = bishop_tables[s][occ & bishop_masks[s]]
+            elif kind == 3:  # rook
+                attacks = rook_tables[s][occ & rook_masks[s]]
+            elif kind == 4:  # queen
+                attacks = (rook_tables[s][occ & rook_masks[s]]
+                           | bishop_tables[s][occ & bishop_masks[s]])
+            else:            # king
+                attacks = KING_ATTACKS[s]
+            targets = attacks & enemies
+            while targets:
+                t = targets & -targets
+                add_capture(plain[s | (t.bit_length() - 1) << TO_SHIFT])
+                targets ^= t
+            targets = attacks & empty
+            while targets:
+                t = targets & -targets
+                add_quiet(plain[s | (t.bit_length() - 1) << TO_SHIFT])
+                targets ^= t
+    return captures, quiets
+
+
+_PROMOTIONS = (_QUEEN, _ROOK, _BISHOP, _KNIGHT)
+
+_RANK_8 = 0xFF                # row 0 — white promotes here
+_RANK_7 = 0xFF << 8           # row 1 — black pawns start here
+_RANK_6 = 0xFF << 16          # row 2 — black pawns after a single push from rank 7
+_RANK_3 = 0xFF << 40          # row 5 — white pawns after a single push from rank 2
+_RANK_2 = 0xFF << 48          # row 6 — white pawns start here
+_RANK_1 = 0xFF << 56          # row 7 — black promotes here
+_NOT_FILE_A = ~FILE_A & BB_ALL
+_NOT_FILE_H = ~FILE_H & BB_ALL
+
+
+def _pawn_moves(board: 'Board', color: Color, captures: list[Move], quiets: list[Move]) -> None:
+    """
+    Append all pawn moves for *color*, generated set-wise for every pawn at
+    once, to *captures* or *quiets*.
+    """
+    pawns = board.bb[color * 6 + _PAWN]
+    if not pawns:
+        return
+    enemies = board.occ[color ^ 1]
+    empty = ~(board.occ[0] | board.occ[1]) & BB_ALL
+
+    # Each target set comes with the offset back to the pawn's square
+    # and the list it goes to
+    if color == _WHITE:
+        single = (pawns >> 8) & empty
+        double = ((single & _RANK_3) >> 8) & empty
+        targets = (
+            (single, 8, quiets),
+            (((pawns & _NOT_FILE_A) >> 9) & enemies, 9, captures),
+            (((pawns & _NOT_FILE_H) >> 7) & enemies, 7, captures),
+        )
+        promo_rank = _RANK_8
+        double_offset = 16
+    else:
+        single = (pawns << 8) & empty
+        double = ((single & _RANK_6) << 8) & empty
+        targets = (
+            (single, -8, quiets),
+            (((pawns & _NOT_FILE_A) << 7) & enemies, -7, captures),
+            (((pawns & _NOT_FILE_H) << 9) & enemies, -9, captures),
+        )
+        promo_rank = _RANK_1
+        double_offset = -16
+
+    plain = PLAIN_MOVES
+    for bits, offset, moves in targets:
+        while bits:
+            low = bits & -bits
+            t = low.bit_length() - 1
+            if low & promo_rank:
+                for pt in _PROMOTIONS:
+                    moves.append(Move(t + offset, t, promotion=pt))
             else:
-                moves.append(Move(s, fwd))
-                # Double push
-                if row == start_row:
-                    dbl = sq(row + 2 * direction, col)
-                    if board.squares[dbl] is None:
-                        moves.append(Move(s, dbl))
-
-        # Captures
-        for dc in (-1, 1):
-            nc = col + dc
-            if 0 <= nc <= 7:
-                cap_sq = sq(nr, nc)
-                target = board.squares[cap_sq]
-                if target is not None and target[0] != color:
-                    if nr == promo_row:
-                        for pt in (PieceType.QUEEN, PieceType.ROOK, PieceType.BISHOP, PieceType.KNIGHT):
-                            moves.append(Move(s, cap_sq, promotion=pt))
-                    else:
-                        moves.append(Move(s, cap_sq))
-                elif board.ep_square == cap_sq:
-                    moves.append(Move(s, cap_sq, is_en_passant=True))
+                moves.append(plain[t + offset | t << TO_SHIFT])
+            bits ^= low
+
+    while double:
+        low = double & -double
+        t = low.bit_length() - 1
+        quiets.append(plain[t + double_offset | t << TO_SHIFT])
+        double ^= low
+
+    ep = board.ep_square
+    if ep is not None:
+        # Pawns that could capture onto *ep* stand where an enemy pawn on
+        # *ep* would attack
+        capturers = PAWN_ATTACKS[color ^ 1][ep] & pawns
+        while capturers:
+            low = capturers & -capturers
+            quiets.append(Move(low.bit_length() - 1, ep, is_en_passant=True))
+            capturers ^= low
 
-    return moves
 
+# ---------------------------------------------------------------------------
+# Castling
+# ---------------------------------------------------------------------------
 
-def _knight_moves(board: 'Board', s: int, color: Color) -> list[Move]:
-    moves: list[Move] = []
-    row, col = row_col(s)
-    for dr, dc in _KNIGHT_DELTAS:
-        nr, nc = row + dr, col + dc
-        if 0 <= nr <= 7 and 0 <= nc <= 7:
-            ts = sq(nr, nc)
-            t = board.squares[ts]
-            if t is None or t[0] != color:
-                moves.append(Move(s, ts))
-    return moves
+def _castle_spec(right: int, row: int, king_to_col: int, rook_col: int) -> tuple:
+    """
+    Return (right, king_from, king_to, rook_sq, empty, safe) for one castle.
 
-
-def _sliding(board: 'Board', s: int, color: Color, directions: list) -> list[Move]:
-    moves: list[Move] = []
-    row, col = row_col(s)
-    for dr, dc in directions:
-        r, c = row + dr, col + dc
-        while 0 <= r <= 7 and 0 <= c <= 7:
-            ts = sq(r, c)
-            t = board.squares[ts]
-            if t is None:
-                moves.append(Move(s, ts))
-            elif t[0] != color:
-                moves.append(Move(s, ts))
-                break
-            else:
-                break
-            r += dr
-            c += dc
-    return moves
+    *empty* is the bitboard of squares between king and rook; *safe* lists
+    the squares the king stands on, crosses and lands on.
+    """
+    king_from, king_to, rook_sq = sq(row, 4), sq(row, king_to_col), sq(row, rook_col)
+    empty = sum(1 << s for s in range(min(king_from, rook_sq) + 1, max(king_from, rook_sq)))
+    step = 1 if king_to > king_from else -1
+    safe = tuple(range(king_from, king_to + step, step))
+    return right, king_from, king_to, rook_sq, empty, safe
 
 
-def _king_moves(board: 'Board', s: int, color: Color) -> list[Move]:
-    moves: list[Move] = []
-    row, col = row_col(s)
-    for dr, dc in _KING_DELTAS:
-        nr, nc = row + dr, col + dc
-        if 0 <= nr <= 7 and 0 <= nc <= 7:
-            ts = sq(nr, nc)
-            t = board.squares[ts]
-            if t is None or t[0] != color:
-                moves.append(Move(s, ts))
-    return moves
+# Per color: (king square, kingside spec, queenside spec)
+_CASTLE_SPECS = (
+    (sq(7, 4), _castle_spec(CR_WK, 7, 6, 7), _castle_spec(CR_WQ, 7, 2, 0)),
+    (sq(0, 4), _castle_spec(CR_BK, 0, 6, 7), _castle_spec(CR_BQ, 0, 2, 0)),
+)
 
 
-# ---------------------------------------------------------------------------
-# Castling
-# ---------------------------------------------------------------------------
-
 def _castling_moves(board: 'Board', color: Color) -> list[Move]:
     moves: list[Move] = []
-    opponent = Color.BLACK if color == Color.WHITE else Color.WHITE
-
-    if color == Color.WHITE:
-        king_sq = sq(7, 4)
-        if board.squares[king_sq] != (Color.WHITE, PieceType.KING):
-            return moves
-        # Kingside
-        if (board.castling_rights.get('K')
-                and board.squares[sq(7, 7)] == (Color.WHITE, PieceType.ROOK)
-                and board.squares[sq(7, 5)] is None
-                and board.squares[sq(7, 6)] is None
-                and not _is_attacked(board, sq(7, 4), opponent)
-                and not _is_attacked(board, sq(7, 5), opponent)
-                and not _is_attacked(board, sq(7, 6), opponent)):
-            moves.append(Move(king_sq, sq(7, 6), is_castle=True))
-        # Queenside
-        if (board.castling_rights.get('Q')
-                and board.squares[sq(7, 0)] == (Color.WHITE, PieceType.ROOK)
-                and board.squares[sq(7, 3)] is None
-                and board.squares[sq(7, 2)] is None
-                and board.squares[sq(7, 1)] is None
-                and not _is_attacked(board, sq(7, 4), opponent)
-                and not _is_attacked(board, sq(7, 3), opponent)
-                and not _is_attacked(board, sq(7, 2), opponent)):
-            moves.append(Move(king_sq, sq(7, 2), is_castle=True))
-    else:
-        king_sq = sq(0, 4)
-        if board.squares[king_sq] != (Color.BLACK, PieceType.KING):
-            return moves
-        # Kingside
-        if (board.castling_rights.get('k')
-                and board.squares[sq(0, 7)] == (Color.BLACK, PieceType.ROOK)
-                and board.squares[sq(0, 5)] is None
-                and board.squares[sq(0, 6)] is None
-                and not _is_attacked(board, sq(0, 4), opponent)
-                and not _is_attacked(board, sq(0, 5), opponent)
-                and not _is_attacked(board, sq(0, 6), opponent)):
-            moves.append(Move(king_sq, sq(0, 6), is_castle=True))
-        # Queenside
-        if (board.castling_rights.get('q')
-                and board.squares[sq(0, 0)] == (Color.BLACK, PieceType.ROOK)
-                and board.squares[sq(0, 3)] is None
-                and board.squares[sq(0, 2)] is None
-                and board.squares[sq(0, 1)] is None
-                and not _is_attacked(board, sq(0, 4), opponent)
-                and not _is_attacked(board, sq(0, 3), opponent)
-                and not _is_attacked(board, sq(0, 2), opponent)):
-            moves.append(Move(king_sq, sq(0, 2), is_castle=True))
-
+    king_sq, *specs = _CASTLE_SPECS[color]
+    bb = board.bb
+    base = color * 6
+    if not (board.castling and bb[base + _KING] >> king_sq & 1):
+        return moves
+    rooks = bb[base + _ROOK]
+    occ = board.occ[0] | board.occ[1]
+    opponent = color ^ 1
+    for right, king_from, king_to, rook_sq, empty, safe in specs:
+        if not (board.castling & right and rooks >> rook_sq & 1) or occ & empty:
+            continue
+        for s in safe:
+            if _is_attacked(board, s, opponent, occ):
+                break
+        else:
+            moves.append(Move(king_from, king_to, is_castle=True))
     return moves
 
 
@@ -221,58 +439,66 @@ def _castling_moves(board: 'Board', color: Color) -> list[Move]:
 # Attack detection
 # ---------------------------------------------------------------------------
 
-def _is_attacked(board: 'Board', square: int, by_color: Color) -> bool:
-    """Return True if *square* is attacked by *by_color*."""
-    row, col = row_col(square)
-
-    # Pawn attacks: pawns of by_color attack *from* the row in front of them
-    pawn_from_row = row + (1 if by_color == Color.WHITE else -1)
-    if 0 <= pawn_from_row <= 7:
-        for dc in (-1, 1):
-            pc = col + dc
-            if 0 <= pc <= 7:
-                p = board.squares[sq(pawn_from_row, pc)]
-                if p and p[0] == by_color and p[1] == PieceType.PAWN:
-                    return True
-
-    # Knight attacks
-    for dr, dc in _KNIGHT_DELTAS:
-        nr, nc = row + dr, col + dc
-        if 0 <= nr <= 7 and 0 <= nc <= 7:
-            p = board.squares[sq(nr, nc)]
-            if p and p[0] == by_color and p[1] == PieceType.KNIGHT:
-                return True
-
-    # Orthogonal sliders (rook, queen)
-    for dr, dc in _ORTH:
-        r, c = row + dr, col + dc
-        while 0 <= r <= 7 and 0 <= c <= 7:
-            p = board.squares[sq(r, c)]
-            if p:
-                if p[0] == by_color and p[1] in (PieceType.ROOK, PieceType.QUEEN):
-                    return True
-                break
-            r += dr
-            c += dc
-
-    # Diagonal sliders (bishop, queen)
-    for dr, dc in _DIAG:
-        r, c = row + dr, col + dc
-        while 0 <= r <= 7 and 0 <= c <= 7:
-            p = board.squares[sq(r, c)]
-            if p:
-                if p[0] == by_color and p[1] in (PieceType.BISHOP, PieceType.QUEEN):
-                    return True
-                break
-            r += dr
-            c += dc
-
-    # King attacks
-    for dr, dc in _KING_DELTAS:
-        nr, nc = row + dr, col + dc
-        if 0 <= nr <= 7 and 0 <= nc <= 7:
-            p = board.squares[sq(nr, nc)]
-            if p and p[0] == by_color and p[1] == PieceType.KING:
-                return True
-
-    return False
+def _check_info(board: 'Board', color: Color, king_sq: int) -> tuple[int, int]:
+    """
+    Return (checkers, pinned) bitboards for *color*'s king on *king_sq*.
+
+    *checkers* are the enemy pieces giving check; *pinned* are *color*'s
+    pieces that are the only piece between the king and an enemy slider.
+    """
+    bb = board.bb
+    base = (color ^ 1) * 6
+    own = board.occ[color]
+    occ = own | board.occ[color ^ 1]
+    queens = bb[base + _QUEEN]
+    orth = bb[base + _ROOK] | queens
+    diag = bb[base + _BISHOP] | queens
+
+    # The slider tables are read directly; entry 0 (no blockers) is the
+    # piece's full reach on an empty board
+    rook_table = ROOK_TABLES[king_sq]
+    bishop_table = BISHOP_TABLES[king_sq]
+    checkers = (
+        (PAWN_ATTACKS[color][king_sq] & bb[base + _PAWN])
+        | (KNIGHT_ATTACKS[king_sq] & bb[base + _KNIGHT])
+        | (rook_table[occ & ROOK_MASKS[king_sq]] & orth)
+        | (bishop_table[occ & BISHOP_MASKS[king_sq]] & diag)
+    )
+
+    # Sliders aimed at the king on an empty board, blocked by one own piece
+    pinned = 0
+    snipers = (rook_table[0] & orth) | (bishop_table[0] & diag)
+    between_king = BETWEEN[king_sq]
+    while snipers:
+        low = snipers & -snipers
+        snipers ^= low
+        blockers = between_king[low.bit_length() - 1] & occ
+        if blockers and not blockers & (blockers - 1) and blockers & own:
+            pinned |= blockers
+    return checkers, pinned
+
+
+def _is_attacked(board: 'Board', square: int, by_color: Color, occ: Optional[int] = None) -> bool:
+    """
+    Return True if *square* is attacked by *by_color*.
+
+    Sliders are traced through *occ* when given, instead of the board's
+    actual occupancy.
+
+    One short-circuiting expression: each term ANDs the attack set *from*
+    *square* with the attacker bitboard, cheapest (leaper) terms first.
+    A pawn of by_color attacks *square* iff a pawn of the other color on
+    *square* would attack the pawn's square.
+    """
+    bb = board.bb
+    base = 6 if by_color else 0
+    if occ is None:
+        occ = board.occ[0] | board.occ[1]
+    queens = bb[base + 4]
+    return bool(
+        PAWN_ATTACKS[by_color ^ 1][square] & bb[base]
+        or KNIGHT_ATTACKS[square] & bb[base + 1]
+        or KING_ATTACKS[square] & bb[base + 5]
+        or ROOK_TABLES[square][occ & ROOK_MASKS[square]] & (bb[base + 3] | queens)
+        or BISHOP_TABLES[square][occ & BISHOP_MASKS[square]] & (bb[base + 2] | queens)
+    )
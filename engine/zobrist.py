@@ -1,7 +1,8 @@
 """Zobrist hashing for fast threefold-repetition detection."""
 import random
+from array import array
 
-from engine.constants import Color, PieceType
+from engine.constants import CR_BK, CR_BQ, CR_WK, CR_WQ, Color, PieceType
 
 
 class ZobristHasher:
@@ -10,14 +11,9 @@ class ZobristHasher:
     def __init__(self, seed: int = 42) -> None:
         rng = random.Random(seed)
 
-        # piece_table[color_int][piece_type_int][square]
-        self.piece_table: list[list[list[int]]] = [
-            [
-                [rng.getrandbits(64) for _ in range(64)]
-                for _ in range(6)  # 6 piece types
-            ]
-            for _ in range(2)  # 2 colors
-        ]
+        # piece_table[(color * 6 + piece_type) * 64 + square], 2 colors x
+        # 6 piece types x 64 squares in one flat array of unsigned 64-bit ints
+        self.piece_table: array = array('Q', [rng.getrandbits(64) for _ in range(2 * 6 * 64)])
         self.black_to_move: int = rng.getrandbits(64)
         # Castling: K, Q, k, q
         self.castling: list[int] = [rng.getrandbits(64) for _ in range(4)]
@@ -27,16 +23,43 @@ class ZobristHasher:
     def hash_board(self, board) -> int:
         """Compute the full Zobrist hash for the given Board."""
         h = 0
-        for s in range(64):
-            piece = board.squares[s]
-            if piece is not None:
-                color, pt = piece
-                h ^= self.piece_table[int(color)][int(pt)][s]
+        piece_table = self.piece_table
+        # Board.bb is indexed by color * 6 + piece_type, like the table
+        for idx, pieces in enumerate(board.bb):
+            base = idx * 64
+            while pieces:
+                low = pieces & -pieces
+                h ^= piece_table[base + low.bit_length() - 1]
+                pieces ^= low
         if board.turn == Color.BLACK:
             h ^= self.black_to_move
-        for i, key in enumerate(('K', 'Q', 'k', 'q')):
-            if board.castling_rights.get(key):
+        for i, flag in enumerate((CR_WK, CR_WQ, CR_BK, CR_BQ)):
+            if board.castling & flag:
                 h ^= self.castling[i]
         if board.ep_square is not None:
             h ^= self.ep_file[board.ep_square % 8]
         return h
+
+
+# ---------------------------------------------------------------------------
+# Flat key tables for Board's incremental hash
+# ---------------------------------------------------------------------------
+# Built from the default-seeded hasher, so Board.zobrist always equals
+# ZobristHasher().hash_board(board).
+
+_DEFAULT = ZobristHasher()
+
+# PIECE_KEYS[(color * 6 + piece_type) * 64 + square] — indexed like Board.bb.
+# A tuple rather than the hasher's array: reading a tuple hands back a
+# stored int, where an array read boxes a new one (~3x slower).
+PIECE_KEYS: tuple[int, ...] = tuple(_DEFAULT.piece_table)
+BLACK_TO_MOVE_KEY: int = _DEFAULT.black_to_move
+# CASTLING_KEYS[board.castling] — the XOR of the keys of every right held
+CASTLING_KEYS: tuple[int, ...] = tuple(
+    (_DEFAULT.castling[0] if mask & CR_WK else 0)
+    ^ (_DEFAULT.castling[1] if mask & CR_WQ else 0)
+    ^ (_DEFAULT.castling[2] if mask & CR_BK else 0)
+    ^ (_DEFAULT.castling[3] if mask & CR_BQ else 0)
+    for mask in range(16)
+)
+EP_FILE_KEYS: tuple[int, ...] = tuple(_DEFAULT.ep_file)
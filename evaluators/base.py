@@ -1,20 +1,20 @@
 """Abstract base class for all chess position evaluators."""
 import abc
-from typing import TYPE_CHECKING
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Mapping
 
-from engine.constants import PieceType
+from engine.constants import PIECE_VALUES, PieceType
 
 if TYPE_CHECKING:
     from engine.game import GameState
 
-STANDARD_VALUES: dict[PieceType, int] = {
-    PieceType.PAWN: 100,
-    PieceType.KNIGHT: 320,
-    PieceType.BISHOP: 330,
-    PieceType.ROOK: 500,
-    PieceType.QUEEN: 900,
-    PieceType.KING: 20000,
-}
+# Read-only copy of PIECE_VALUES.  Board.material is summed from values
+# fixed when engine.board is imported, so these must not change either;
+# to value pieces differently, override piece_value() instead.
+STANDARD_VALUES: Mapping[PieceType, int] = MappingProxyType(dict(PIECE_VALUES))
+
+# Iterating the enum class itself costs ~1us a pass; this tuple is ~20x cheaper
+_PIECE_TYPES: tuple[PieceType, ...] = tuple(PieceType)
 
 
 class EvaluatorBase(abc.ABC):
@@ -44,3 +44,22 @@ class EvaluatorBase(abc.ABC):
     def piece_value(self, piece_type: PieceType) -> int:
         """Standard centipawn value for a piece type (overridable)."""
         return STANDARD_VALUES.get(piece_type, 0)
+
+    def material(self, board) -> int:
+        """
+        Sum of ``piece_value()`` over the board, White minus Black.
+
+        With the standard values this is ``Board.material``, which the board
+        keeps up to date move by move.  A subclass overriding
+        ``piece_value()`` gets a dot product of the piece counts, read off
+        the per-piece bitboards, and its values.
+        """
+        if type(self).piece_value is EvaluatorBase.piece_value:
+            return board.material
+        bb = board.bb
+        score = 0
+        for pt in _PIECE_TYPES:
+            count = bb[pt].bit_count() - bb[6 + pt].bit_count()
+            if count:
+                score += count * self.piece_value(pt)
+        return score
@@ -1,5 +1,4 @@
 """Simple material-count evaluator."""
-from engine.constants import Color
 from evaluators.base import EvaluatorBase
 
 
@@ -11,16 +10,12 @@ class SimpleMaterialEvaluator(EvaluatorBase):
     Kings are included so checkmate (king captured conceptually) is
     reflected in deeply-searched positions, but in practice the search
     terminates at checkmate before king capture.
+
+    The sum itself is ``EvaluatorBase.material()``, which reads the
+    board's running total when the piece values are the standard ones.
     """
 
     name = 'material'
 
     def evaluate(self, game_state) -> int:
-        score = 0
-        for s in range(64):
-            piece = game_state.board.squares[s]
-            if piece is not None:
-                color, pt = piece
-                val = self.piece_value(pt)
-                score += val if color == Color.WHITE else -val
-        return score
+        return self.material(game_state.board)
@@ -88,6 +88,14 @@ def _mirror(square: int) -> int:
     return (7 - square // 8) * 8 + (square % 8)
 
 
+# Tables as seen by each side, indexed like Board.bb: color * 6 + piece type
+_SIDE_PST: tuple[list[int], ...] = tuple(
+    _PST[pt] if color == Color.WHITE else [_PST[pt][_mirror(s)] for s in range(64)]
+    for color in Color
+    for pt in PieceType
+)
+
+
 class PositionalEvaluator(EvaluatorBase):
     """
     Material count plus piece-square table bonuses.
@@ -99,18 +107,19 @@ class PositionalEvaluator(EvaluatorBase):
     name = 'positional'
 
     def evaluate(self, game_state) -> int:
-        score = 0
-        for s in range(64):
-            piece = game_state.board.squares[s]
-            if piece is None:
+        board = game_state.board
+        bb = board.bb
+        score = self.material(board)
+        # Table bonuses: bb[0:6] are White's pieces, bb[6:12] Black's
+        for idx in range(12):
+            pieces = bb[idx]
+            if not pieces:
                 continue
-            color, pt = piece
-            material = self.piece_value(pt)
-            table = _PST.get(pt)
-            if table is not None:
-                positional = table[s] if color == Color.WHITE else table[_mirror(s)]
-            else:
-                positional = 0
-            value = material + positional
-            score += value if color == Color.WHITE else -value
+            table = _SIDE_PST[idx]
+            bonus = 0
+            while pieces:
+                low = pieces & -pieces
+                bonus += table[low.bit_length() - 1]
+                pieces ^= low
+            score += bonus if idx < 6 else -bonus
         return score
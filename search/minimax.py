@@ -4,11 +4,12 @@ Minimax search with alpha-beta pruning.
 MinimaxSearcher is evaluator-agnostic: it accepts any EvaluatorBase
 instance at construction time and never imports a concrete evaluator.
 """
-from typing import Optional, TYPE_CHECKING
+from typing import Iterator, Optional, TYPE_CHECKING
 
+from engine.board import CODE_TYPE
 from engine.constants import Color
-from engine.move import Move
-from engine.move_generator import generate_legal_moves, is_in_check
+from engine.move import TO_SHIFT, Move
+from engine.move_generator import generate_legal_moves, has_legal_move, is_in_check, is_legal_move
 
 if TYPE_CHECKING:
     from evaluators.base import EvaluatorBase
@@ -16,10 +17,19 @@ if TYPE_CHECKING:
 
 _INF = 100_000_000
 
+# Transposition-table entry flags: how the stored value bounds the true one
+_EXACT = 0
+_LOWER = 1  # failed high: true value >= stored value
+_UPPER = 2  # failed low:  true value <= stored value
+
+# Entries kept before the table is cleared (~150 bytes each)
+TT_MAX_ENTRIES = 200_000
+
 
 class MinimaxSearcher:
     """
-    Fixed-depth minimax with alpha-beta pruning and simple move ordering.
+    Fixed-depth minimax with alpha-beta pruning, simple move ordering and a
+    transposition table.
 
     Parameters
     ----------
@@ -27,12 +37,18 @@ class MinimaxSearcher:
         Any EvaluatorBase subclass.  Positive scores favour White.
     depth:
         Half-moves (plies) to search.  Depth 1 = look one move ahead.
+
+    The transposition table maps ``board.zobrist`` to
+    ``(depth, flag, value, best_move)`` and persists across ``best_move``
+    calls on the same searcher (the server's pool workers keep one per
+    evaluator for this); a deeper entry is never replaced by a shallower one.
     """
 
     def __init__(self, evaluator: 'EvaluatorBase', depth: int = 3) -> None:
         self.evaluator = evaluator
         self.depth = depth
         self.nodes_searched: int = 0
+        self.tt: dict[int, tuple[int, int, int, Optional[Move]]] = {}
 
     # ------------------------------------------------------------------
     # Public entry point
@@ -44,12 +60,10 @@ class MinimaxSearcher:
         color = game_state.board.turn
         maximizing = color == Color.WHITE
 
-        legal_moves = generate_legal_moves(game_state.board)
+        legal_moves = _ordered_moves(game_state)
         if not legal_moves:
             return None
 
-        _order_moves(game_state, legal_moves)
-
         best: Optional[Move] = None
         best_score = -_INF if maximizing else _INF
         alpha, beta = -_INF, _INF
@@ -85,41 +99,88 @@ class MinimaxSearcher:
         maximizing: bool,
     ) -> int:
         self.nodes_searched += 1
-
-        legal_moves = generate_legal_moves(game_state.board)
-        current = game_state.board.turn
-
-        if not legal_moves:
-            if is_in_check(game_state.board, current):
-                # Checkmate: the caller (opponent) wins
-                return _INF if maximizing else -_INF
-            return 0  # Stalemate
+        board = game_state.board
+        key = board.zobrist
+
+        # Probe: a deep enough entry ends the search here if its bound
+        # already decides this window
+        tt_move: Optional[Move] = None
+        entry = self.tt.get(key)
+        if entry is not None:
+            tt_depth, flag, tt_value, tt_move = entry
+            if tt_depth >= depth and (
+                flag == _EXACT
+                or (flag == _LOWER and tt_value >= beta)
+                or (flag == _UPPER and tt_value <= alpha)
+            ):
+                return tt_value
 
         if depth == 0:
-            return self.evaluator.evaluate(game_state)
-
-        _order_moves(game_state, legal_moves)
+            if not has_legal_move(board):
+                return self._terminal(board, key, depth, maximizing)
+            value = self.evaluator.evaluate(game_state)
+            self._store(key, depth, _EXACT, value, None)
+            return value
 
+        # Moves come in stages, so a cut-off on the TT move skips move
+        # generation; best stays None only if there were no moves at all
+        alpha_orig, beta_orig = alpha, beta
+        best: Optional[Move] = None
         if maximizing:
             value = -_INF
-            for move in legal_moves:
-                game_state.board.make_move(move)
-                value = max(value, self._search(game_state, depth - 1, alpha, beta, False))
-                game_state.board.undo_move()
+            for move in _phased_moves(game_state, tt_move):
+                board.make_move(move)
+                score = self._search(game_state, depth - 1, alpha, beta, False)
+                board.undo_move()
+                if score > value or best is None:
+                    value = score
+                    best = move
                 alpha = max(alpha, value)
                 if beta <= alpha:
                     break
-            return value
         else:
             value = _INF
-            for move in legal_moves:
-                game_state.board.make_move(move)
-                value = min(value, self._search(game_state, depth - 1, alpha, beta, True))
-                game_state.board.undo_move()
+            for move in _phased_moves(game_state, tt_move):
+                board.make_move(move)
+                score = self._search(game_state, depth - 1, alpha, beta, True)
+                board.undo_move()
+                if score < value or best is None:
+                    value = score
+                    best = move
                 beta = min(beta, value)
                 if beta <= alpha:
                     break
-            return value
+
+        if best is None:
+            return self._terminal(board, key, depth, maximizing)
+
+        if value <= alpha_orig:
+            flag = _UPPER
+        elif value >= beta_orig:
+            flag = _LOWER
+        else:
+            flag = _EXACT
+        self._store(key, depth, flag, value, best)
+        return value
+
+    def _terminal(self, board, key: int, depth: int, maximizing: bool) -> int:
+        """Score and store a position with no legal moves."""
+        if is_in_check(board, board.turn):
+            # Checkmate: the caller (opponent) wins
+            value = _INF if maximizing else -_INF
+        else:
+            value = 0  # Stalemate
+        self._store(key, depth, _EXACT, value, None)
+        return value
+
+    def _store(self, key: int, depth: int, flag: int, value: int, move: Optional[Move]) -> None:
+        tt = self.tt
+        old = tt.get(key)
+        if old is not None and old[0] > depth:
+            return
+        if old is None and len(tt) >= TT_MAX_ENTRIES:
+            tt.clear()
+        tt[key] = (depth, flag, value, move)
 
 
 # ---------------------------------------------------------------------------
@@ -137,20 +198,54 @@ _PIECE_SORT_VALUE: dict[_PT, int] = {
     _PT.KING:   100,
 }
 
+# The same values indexed by Board.mailbox code (0 = empty square)
+_CODE_SORT_VALUE: tuple[int, ...] = tuple(
+    0 if pt is None else _PIECE_SORT_VALUE[pt] for pt in CODE_TYPE
+)
+
 
-def _order_moves(game_state: 'GameState', moves: list[Move]) -> None:
+def _phased_moves(game_state: 'GameState', tt_move: Optional[Move]) -> Iterator[Move]:
     """
-    In-place sort: captures first (MVV-LVA approximation), then quiet moves.
+    Yield the legal moves in search order, generating them lazily.
+
+    Stage 1 is the transposition-table move, checked on its own; the full
+    list is only generated if the search asks for a second move.  Stage 2
+    is the rest, captures (MVV-LVA) ahead of quiet moves.
+    """
+    board = game_state.board
+    if tt_move is not None and is_legal_move(board, tt_move):
+        yield tt_move
+    else:
+        tt_move = None
+    for move in _ordered_moves(game_state):
+        if move != tt_move:
+            yield move
+
+
+def _ordered_moves(game_state: 'GameState') -> list[Move]:
+    """
+    Legal moves with captures first (MVV-LVA approximation), then quiet moves.
     Improves alpha-beta cut-off rate significantly.
+
+    The generator hands the captures over in their own list, so only they
+    are scored and sorted; quiet moves keep generation order.
     """
+    captures: list[Move] = []
+    quiets = generate_legal_moves(game_state.board, captures)
+    if not captures:
+        return quiets
+
+    mailbox = game_state.board.mailbox
 
     def _score(move: Move) -> int:
-        target = game_state.board.squares[move.to_sq]
-        if target is not None:
-            victim_value = _PIECE_SORT_VALUE.get(target[1], 0)
-            attacker = game_state.board.squares[move.from_sq]
-            attacker_value = _PIECE_SORT_VALUE.get(attacker[1], 0) if attacker else 0
-            return -(victim_value * 10 - attacker_value)
-        return 0
-
-    moves.sort(key=_score)
+        return _CODE_SORT_VALUE[mailbox[move & 63]] - _CODE_SORT_VALUE[mailbox[move >> TO_SHIFT & 63]] * 10
+
+    captures.sort(key=_score)
+    # A king taking a cheaper piece scores above zero, which places it after
+    # the quiet moves
+    split = len(captures)
+    while split and _score(captures[split - 1]) > 0:
+        split -= 1
+    if split < len(captures):
+        return captures[:split] + quiets + captures[split:]
+    return captures + quiets
@@ -1,8 +1,10 @@
 """Tests for engine.board — setup, make_move, undo_move."""
+import pickle
+
 import pytest
 
-from engine.board import Board
-from engine.constants import Color, PieceType, sq
+from engine.board import PIECES, Board
+from engine.constants import CR_ALL, CR_BK, CR_WQ, Color, PieceType, sq
 from engine.move import Move
 
 
@@ -127,6 +129,13 @@ def test_castling_rights_restored_on_undo(board):
     assert board.castling_rights['Q']
 
 
+def test_castling_rights_dict_maps_to_bits(board):
+    assert board.castling == CR_ALL
+    board.castling_rights = {'K': False, 'Q': True, 'k': True, 'q': False}
+    assert board.castling == CR_WQ | CR_BK
+    assert board.castling_rights == {'K': False, 'Q': True, 'k': True, 'q': False}
+
+
 def test_promotion(board):
     # Place a white pawn one step from promotion
     board.squares = [None] * 64
@@ -146,3 +155,204 @@ def test_promotion_undo(board):
     board.undo_move()
     assert board.squares[sq(1, 0)] == (Color.WHITE, PieceType.PAWN)
     assert board.squares[sq(0, 0)] is None
+
+
+# ---------------------------------------------------------------------------
+# Bitboards
+# ---------------------------------------------------------------------------
+
+def _bitboards_from_mailbox(board):
+    bb = [0] * 12
+    for s in range(64):
+        p = board.piece_at(s)
+        if p is not None:
+            bb[p[0] * 6 + p[1]] |= 1 << s
+    return bb
+
+
+def test_start_position_bitboards(board):
+    assert board.bb == _bitboards_from_mailbox(board)
+    assert board.bb[Color.WHITE * 6 + PieceType.PAWN] == 0xFF << 48
+    assert board.occ == [0xFFFF << 48, 0xFFFF]
+
+
+def test_square_writes_update_bitboards(board):
+    board.squares[sq(4, 4)] = (Color.BLACK, PieceType.QUEEN)
+    board.squares[sq(7, 3)] = None
+    assert board.bb == _bitboards_from_mailbox(board)
+    assert board.bb[Color.WHITE * 6 + PieceType.QUEEN] == 0
+
+
+def test_find_king(board):
+    assert board.find_king(Color.WHITE) == sq(7, 4)
+    assert board.find_king(Color.BLACK) == sq(0, 4)
+    board.squares[sq(0, 4)] = None
+    assert board.find_king(Color.BLACK) is None
+
+
+def test_bitboards_survive_make_undo(board):
+    start = board.bb[:]
+    for uci in ('e2e4', 'd7d5', 'e4d5', 'd8d5'):
+        board.make_move(Move.from_uci(uci))
+        assert board.bb == _bitboards_from_mailbox(board)
+    for _ in range(4):
+        board.undo_move()
+    assert board.bb == start
+
+
+def test_occupancy_survives_make_undo(board):
+    start = board.occ[:]
+    for uci in ('e2e4', 'd7d5', 'e4d5', 'd8d5'):
+        board.make_move(Move.from_uci(uci))
+        bb = _bitboards_from_mailbox(board)
+        assert board.occ == [
+            bb[0] | bb[1] | bb[2] | bb[3] | bb[4] | bb[5],
+            bb[6] | bb[7] | bb[8] | bb[9] | bb[10] | bb[11],
+        ]
+    for _ in range(4):
+        board.undo_move()
+    assert board.occ == start
+
+
+def test_rook_move_clears_only_its_castling_right(board):
+    board.squares[sq(7, 6)] = None
+    board.squares[sq(7, 5)] = None
+    board.make_move(Move(sq(7, 7), sq(7, 6)))  # Rh1-g1
+    assert board.castling_rights == {'K': False, 'Q': True, 'k': True, 'q': True}
+
+
+def test_rook_capture_clears_castling_right(board):
+    board.squares[sq(1, 7)] = None  # open the h-file for the white rook
+    board.squares[sq(6, 7)] = None
+    board.make_move(Move(sq(7, 7), sq(0, 7)))  # Rh1xh8
+    assert not board.castling_rights['k']
+    assert not board.castling_rights['K']
+    assert board.castling_rights['q']
+
+
+def test_en_passant_capture_and_undo(board):
+    for uci in ('e2e4', 'a7a6', 'e4e5', 'd7d5'):
+        board.make_move(Move.from_uci(uci))
+    start = board.bb[:]
+    board.make_move(Move(sq(3, 4), sq(2, 3), is_en_passant=True))  # exd6 e.p.
+    assert board.squares[sq(2, 3)] == (Color.WHITE, PieceType.PAWN)
+    assert board.squares[sq(3, 3)] is None
+    assert board.halfmove_clock == 0
+    board.undo_move()
+    assert board.squares[sq(3, 3)] == (Color.BLACK, PieceType.PAWN)
+    assert board.squares[sq(3, 4)] == (Color.WHITE, PieceType.PAWN)
+    assert board.ep_square == sq(2, 3)
+    assert board.bb == start
+
+
+def test_castling_moves_rook_and_undo(board):
+    for col in (5, 6):
+        board.squares[sq(7, col)] = None
+    board.make_move(Move(sq(7, 4), sq(7, 6), is_castle=True))
+    assert board.squares[sq(7, 6)] == (Color.WHITE, PieceType.KING)
+    assert board.squares[sq(7, 5)] == (Color.WHITE, PieceType.ROOK)
+    assert board.squares[sq(7, 7)] is None
+    board.undo_move()
+    assert board.squares[sq(7, 4)] == (Color.WHITE, PieceType.KING)
+    assert board.squares[sq(7, 7)] == (Color.WHITE, PieceType.ROOK)
+    assert board.squares[sq(7, 5)] is None
+    assert board.bb == _bitboards_from_mailbox(board)
+
+
+def test_snapshot_reads_position(board):
+    board.make_move(Move.from_uci('e2e4'))
+    snap = board.snapshot()
+    assert snap.piece_at(sq(4, 4)) == (Color.WHITE, PieceType.PAWN)
+    assert snap.find_king(Color.BLACK) == sq(0, 4)
+    assert snap.turn == Color.BLACK
+    assert snap.ep_square == sq(5, 4)
+    assert snap.castling_rights == board.castling_rights
+
+
+def test_snapshot_is_unaffected_by_later_moves(board):
+    snap = board.snapshot()
+    board.make_move(Move.from_uci('e2e4'))
+    assert snap.piece_at(sq(6, 4)) == (Color.WHITE, PieceType.PAWN)
+    restored = pickle.loads(pickle.dumps(snap))
+    assert restored.piece_at(sq(4, 4)) is None
+    assert restored.bb == _bitboards_from_mailbox(restored)
+    assert restored.zobrist == snap.zobrist != board.zobrist
+
+
+def test_snapshot_pickles_as_independent_board(board):
+    restored = pickle.loads(pickle.dumps(board.snapshot()))
+    assert isinstance(restored, Board)
+    assert restored.mailbox == board.mailbox
+    assert restored.mailbox is not board.mailbox
+    assert restored.piece_at(sq(7, 4)) is PIECES[Color.WHITE * 6 + PieceType.KING]
+    restored.make_move(Move.from_uci('e2e4'))
+    assert board.squares[sq(6, 4)] == (Color.WHITE, PieceType.PAWN)
+
+
+def test_history_grows_past_preallocated_size(board):
+    start = board.mailbox[:]
+    shuffle = [Move.from_uci(u) for u in ('g1f3', 'g8f6', 'f3g1', 'f6g8')]
+    for i in range(600):
+        board.make_move(shuffle[i % 4])
+    for _ in range(600):
+        board.undo_move()
+    assert board.mailbox == start
+    assert board.fullmove_number == 1
+    board.undo_move()  # empty stack: no-op
+    assert board.mailbox == start
+
+
+def test_incremental_zobrist_matches_full_hash(board):
+    from engine.zobrist import ZobristHasher
+    hasher = ZobristHasher()
+    start = board.zobrist
+    assert start == hasher.hash_board(board)
+    # Double pushes, en passant, castling and a capture
+    moves = [Move.from_uci(u) for u in ('e2e4', 'g8f6', 'e4e5', 'd7d5')]
+    moves.append(Move(sq(3, 4), sq(2, 3), is_en_passant=True))  # exd6 e.p.
+    moves += [Move.from_uci(u) for u in ('e7d6', 'g1f3', 'b8c6', 'f1c4', 'c8g4')]
+    moves.append(Move(sq(7, 4), sq(7, 6), is_castle=True))  # O-O
+    for move in moves:
+        board.make_move(move)
+        assert board.zobrist == hasher.hash_board(board)
+    for _ in moves:
+        board.undo_move()
+        assert board.zobrist == hasher.hash_board(board)
+    assert board.zobrist == start
+
+
+def _material_from_mailbox(board):
+    from engine.constants import PIECE_VALUES
+    total = 0
+    for s in range(64):
+        p = board.piece_at(s)
+        if p is not None:
+            total += PIECE_VALUES[p[1]] if p[0] == Color.WHITE else -PIECE_VALUES[p[1]]
+    return total
+
+
+def test_incremental_material_tracks_captures_and_promotion():
+    b = Board()
+    b.squares[sq(7, 4)] = (Color.WHITE, PieceType.KING)
+    b.squares[sq(1, 0)] = (Color.WHITE, PieceType.PAWN)
+    b.squares[sq(3, 4)] = (Color.WHITE, PieceType.PAWN)
+    b.squares[sq(0, 7)] = (Color.BLACK, PieceType.KING)
+    b.squares[sq(0, 1)] = (Color.BLACK, PieceType.ROOK)
+    b.squares[sq(1, 3)] = (Color.BLACK, PieceType.PAWN)
+    b.turn = Color.BLACK
+    assert b.material == _material_from_mailbox(b) == 100 * 2 - 500 - 100
+    start = b.material
+    moves = [
+        Move.from_uci('d7d5'),
+        Move(sq(3, 4), sq(2, 3), is_en_passant=True),   # exd6 e.p.
+        Move.from_uci('h8g8'),
+        Move(sq(1, 0), sq(0, 1), promotion=PieceType.QUEEN),  # axb8=Q
+    ]
+    for move in moves:
+        b.make_move(move)
+        assert b.material == _material_from_mailbox(b)
+    assert b.material == 100 + 900
+    for _ in moves:
+        b.undo_move()
+        assert b.material == _material_from_mailbox(b)
+    assert b.material == start
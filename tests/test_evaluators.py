@@ -1,38 +1,16 @@
 """Tests for evaluators.material and evaluators.positional."""
 import pytest
 
-from engine.board import Board
-from engine.constants import Color, PieceType, sq
+from engine.constants import PIECE_VALUES, PieceType, sq
 from engine.game import GameState
+from evaluators.base import STANDARD_VALUES
 from evaluators.material import SimpleMaterialEvaluator
 from evaluators.positional import PositionalEvaluator
 
 
 def _bare_game(white_pieces, black_pieces):
     """Helper: create a GameState with only specified pieces."""
-    g = GameState.__new__(GameState)
-    g.board = Board()
-    g.board.squares = [None] * 64
-    for s, pt in white_pieces:
-        g.board.squares[s] = (Color.WHITE, pt)
-    for s, pt in black_pieces:
-        g.board.squares[s] = (Color.BLACK, pt)
-    g.board.turn = Color.WHITE
-    g.board.castling_rights = {'K': False, 'Q': False, 'k': False, 'q': False}
-    g.board.ep_square = None
-    g.board.halfmove_clock = 0
-    g.board.fullmove_number = 1
-    g.board._history = []
-    from engine.zobrist import ZobristHasher
-    g._hasher = ZobristHasher()
-    g._position_counts = {}
-    g._move_history = []
-    g._cached_legal = None
-    from engine.game import GameResult
-    g.result = GameResult.ONGOING
-    g.draw_reason = None
-    g.resignation = None
-    return g
+    return GameState.from_pieces(white_pieces, black_pieces)
 
 
 # ---------------------------------------------------------------------------
@@ -70,6 +48,11 @@ class TestSimpleMaterialEvaluator:
         )
         assert self.ev.evaluate(g) == 0
 
+    def test_standard_values_are_read_only(self):
+        with pytest.raises(TypeError):
+            STANDARD_VALUES[PieceType.PAWN] = 200
+        assert STANDARD_VALUES is not PIECE_VALUES
+
     def test_piece_value_overridable(self):
         class DoubledPawns(SimpleMaterialEvaluator):
             def piece_value(self, pt):
@@ -111,6 +94,28 @@ class TestPositionalEvaluator:
         )
         assert self.ev.evaluate(g_center) > self.ev.evaluate(g_edge)
 
+    def test_mirrored_pieces_cancel(self):
+        """Each Black piece reads its table through the rank mirror."""
+        g = _bare_game(
+            [(sq(7,6), PieceType.KING), (sq(5,2), PieceType.KNIGHT), (sq(4,3), PieceType.PAWN)],
+            [(sq(0,6), PieceType.KING), (sq(2,2), PieceType.KNIGHT), (sq(3,3), PieceType.PAWN)],
+        )
+        assert self.ev.evaluate(g) == 0
+        g.board.put_piece(sq(2,2), None)
+        assert self.ev.evaluate(g) == 320 + 10  # knight value + c3 bonus
+
+    def test_piece_value_overridable(self):
+        class DoubledPawns(PositionalEvaluator):
+            def piece_value(self, pt):
+                base = super().piece_value(pt)
+                return base * 2 if pt == PieceType.PAWN else base
+
+        g = _bare_game(
+            [(sq(7,4), PieceType.KING), (sq(4,4), PieceType.PAWN)],
+            [(sq(0,4), PieceType.KING)],
+        )
+        assert DoubledPawns().evaluate(g) == self.ev.evaluate(g) + 100
+
     def test_name(self):
         assert self.ev.name == 'positional'
 
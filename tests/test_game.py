@@ -51,6 +51,34 @@ def test_legal_moves_invalidated_after_move():
     assert before is not after
 
 
+def test_legal_moves_by_key_matches_list():
+    g = make_game()
+    by_key = g.legal_moves_by_key
+    assert len(by_key) == len(g.legal_moves)
+    assert by_key[(sq(6, 4), sq(4, 4), None)] == Move(sq(6, 4), sq(4, 4))
+    assert (sq(6, 4), sq(3, 4), None) not in by_key
+
+
+def test_legal_moves_by_key_invalidated_after_move():
+    g = make_game()
+    before = g.legal_moves_by_key
+    g.make_move(Move(sq(6, 4), sq(4, 4)))
+    assert g.legal_moves_by_key is not before
+    assert (sq(1, 4), sq(3, 4), None) in g.legal_moves_by_key
+
+
+def test_legal_moves_by_key_promotions():
+    b = Board()
+    b.squares[sq(1, 0)] = (Color.WHITE, PieceType.PAWN)
+    b.squares[sq(7, 4)] = (Color.WHITE, PieceType.KING)
+    b.squares[sq(0, 7)] = (Color.BLACK, PieceType.KING)
+    b.turn = Color.WHITE
+    by_key = GameState(b).legal_moves_by_key
+    for pt in (PieceType.QUEEN, PieceType.ROOK, PieceType.BISHOP, PieceType.KNIGHT):
+        assert by_key[(sq(1, 0), sq(0, 0), pt)].promotion == pt
+    assert (sq(1, 0), sq(0, 0), None) not in by_key
+
+
 # ---------------------------------------------------------------------------
 # Resignation
 # ---------------------------------------------------------------------------
@@ -96,29 +124,13 @@ def test_scholars_mate():
 
 def test_stalemate_detected():
     """Set up a stalemate position manually."""
-    g = GameState.__new__(GameState)
-    g.board = Board()
-    g.board.squares = [None] * 64
     # Black king cornered, no legal moves, not in check
-    g.board.squares[sq(0, 0)] = (Color.BLACK, PieceType.KING)
-    g.board.squares[sq(2, 1)] = (Color.WHITE, PieceType.QUEEN)  # covers b8,a7
-    g.board.squares[sq(7, 7)] = (Color.WHITE, PieceType.KING)
-    g.board.turn = Color.BLACK
-    g.board.castling_rights = {'K': False, 'Q': False, 'k': False, 'q': False}
-    g.board.ep_square = None
-    g.board.halfmove_clock = 0
-    g.board.fullmove_number = 1
-    g.board._history = []
-    from engine.zobrist import ZobristHasher
-    g._hasher = ZobristHasher()
-    g._position_counts = {}
-    g._move_history = []
-    g._cached_legal = None
-    g.result = GameResult.ONGOING
-    g.draw_reason = None
-    g.resignation = None
-    g._record_position()
-    g._update_result()
+    g = GameState.from_pieces(
+        [(sq(2, 1), PieceType.QUEEN),  # covers b8,a7
+         (sq(7, 7), PieceType.KING)],
+        [(sq(0, 0), PieceType.KING)],
+        turn=Color.BLACK,
+    )
     assert g.result == GameResult.DRAW
     assert g.draw_reason == DrawReason.STALEMATE
 
@@ -139,6 +151,7 @@ def test_fifty_move_rule():
     g.board.squares[sq(7, 1)] = None  # remove Nb1
     g.board.squares[sq(5, 2)] = (Color.WHITE, PieceType.KNIGHT)  # knight at c3
     g._cached_legal = None
+    g._legal_by_key = None
     ok = g.make_move(Move(sq(5, 2), sq(3, 3)))
     # halfmove clock should now be 100 → draw
     assert g.result == GameResult.DRAW
@@ -191,3 +204,48 @@ def test_to_dict_structure():
     assert d['turn'] == 'WHITE'
     assert d['result'] == 'ongoing'
     assert len(d['board']) == 32
+
+
+def test_game_from_existing_board():
+    b = Board()
+    b.squares[sq(0, 0)] = (Color.BLACK, PieceType.KING)
+    b.squares[sq(2, 1)] = (Color.WHITE, PieceType.QUEEN)
+    b.squares[sq(7, 7)] = (Color.WHITE, PieceType.KING)
+    b.turn = Color.BLACK
+    b.castling_rights = {'K': False, 'Q': False, 'k': False, 'q': False}
+    g = GameState(b)
+    assert g.board is b
+    assert g.result == GameResult.DRAW
+    assert g.draw_reason == DrawReason.STALEMATE
+
+
+# ---------------------------------------------------------------------------
+# Insufficient material
+# ---------------------------------------------------------------------------
+
+def _game_with(pieces):
+    b = Board()
+    for s, piece in pieces.items():
+        b.squares[s] = piece
+    b.castling_rights = {'K': False, 'Q': False, 'k': False, 'q': False}
+    return GameState(b)
+
+
+@pytest.mark.parametrize('extra, drawn', [
+    ({}, True),
+    ({sq(4, 4): (Color.WHITE, PieceType.KNIGHT)}, True),
+    ({sq(4, 4): (Color.BLACK, PieceType.BISHOP)}, True),
+    ({sq(4, 4): (Color.WHITE, PieceType.ROOK)}, False),
+    ({sq(4, 4): (Color.WHITE, PieceType.PAWN)}, False),
+    # Bishops on the same square color (e4 and c2), then on opposite colors
+    ({sq(4, 4): (Color.WHITE, PieceType.BISHOP), sq(6, 2): (Color.BLACK, PieceType.BISHOP)}, True),
+    ({sq(4, 4): (Color.WHITE, PieceType.BISHOP), sq(6, 3): (Color.BLACK, PieceType.BISHOP)}, False),
+    ({sq(4, 4): (Color.WHITE, PieceType.BISHOP), sq(6, 2): (Color.WHITE, PieceType.BISHOP)}, False),
+])
+def test_insufficient_material(extra, drawn):
+    g = _game_with({
+        sq(7, 0): (Color.WHITE, PieceType.KING),
+        sq(0, 7): (Color.BLACK, PieceType.KING),
+        **extra,
+    })
+    assert (g.draw_reason == DrawReason.INSUFFICIENT) is drawn
@@ -0,0 +1,47 @@
+"""Tests for engine.move — packed Move encoding."""
+import pickle
+
+from engine.constants import PieceType, sq
+from engine.move import PLAIN_MOVES, Move
+
+
+def test_fields_round_trip():
+    m = Move(sq(1, 0), sq(0, 1), promotion=PieceType.KNIGHT)
+    assert (m.from_sq, m.to_sq, m.promotion) == (sq(1, 0), sq(0, 1), PieceType.KNIGHT)
+    assert not m.is_castle and not m.is_en_passant
+    castle = Move(sq(7, 4), sq(7, 6), is_castle=True)
+    assert castle.is_castle and castle.promotion is None
+    assert Move(sq(3, 4), sq(2, 3), is_en_passant=True).is_en_passant
+
+
+def test_every_promotion_piece_encodes():
+    for pt in PieceType:
+        assert Move(sq(1, 7), sq(0, 7), promotion=pt).promotion == pt
+
+
+def test_move_is_an_int():
+    m = Move(sq(6, 4), sq(4, 4))
+    assert isinstance(m, int)
+    assert m == Move.from_uci('e2e4')
+    assert hash(m) == hash(Move.from_uci('e2e4'))
+    assert m != Move(sq(6, 4), sq(4, 4), promotion=PieceType.QUEEN)
+
+
+def test_plain_moves_are_shared():
+    m = Move(sq(6, 4), sq(4, 4))
+    assert m is Move.from_uci('e2e4') is PLAIN_MOVES[m]
+    assert all(Move.from_uci(plain.uci()) is plain for plain in PLAIN_MOVES)
+    assert Move(sq(1, 0), sq(0, 0), promotion=PieceType.QUEEN) is not PLAIN_MOVES[sq(1, 0) | sq(0, 0) << 6]
+
+
+def test_uci_round_trip():
+    for uci in ('e2e4', 'a7a8q', 'h2h1n', 'e1g1'):
+        assert Move.from_uci(uci).uci() == uci
+    assert repr(Move.from_uci('g1f3')) == 'Move(g1f3)'
+
+
+def test_pickle_keeps_flags():
+    m = Move(sq(7, 4), sq(7, 2), is_castle=True)
+    restored = pickle.loads(pickle.dumps(m))
+    assert type(restored) is Move
+    assert restored == m and restored.is_castle
@@ -4,7 +4,14 @@ import pytest
 from engine.board import Board
 from engine.constants import Color, PieceType, sq
 from engine.move import Move
-from engine.move_generator import generate_legal_moves, is_in_check, is_square_attacked
+from engine.move_generator import (
+    generate_legal_moves,
+    has_legal_move,
+    is_in_check,
+    is_legal_move,
+    is_pseudo_legal,
+    is_square_attacked,
+)
 
 
 @pytest.fixture()
@@ -183,6 +190,32 @@ def test_only_legal_moves_in_check():
         b.undo_move()
 
 
+def test_king_cannot_retreat_along_checking_line():
+    b = Board()
+    b.squares[sq(7, 4)] = (Color.WHITE, PieceType.KING)
+    b.squares[sq(3, 4)] = (Color.BLACK, PieceType.ROOK)
+    b.squares[sq(0, 0)] = (Color.BLACK, PieceType.KING)
+    b.turn = Color.WHITE
+    b.castling_rights = {'K': False, 'Q': False, 'k': False, 'q': False}
+    targets = {m.to_sq for m in generate_legal_moves(b)}
+    assert sq(6, 4) not in targets  # still on the rook's file
+    assert targets == {sq(7, 3), sq(7, 5), sq(6, 3), sq(6, 5)}
+
+
+def test_en_passant_cannot_expose_king_on_rank():
+    # White Ka5, Pb5; Black ...c7-c5 with a rook on h5 behind the pawns
+    b = Board()
+    b.squares[sq(3, 0)] = (Color.WHITE, PieceType.KING)
+    b.squares[sq(3, 1)] = (Color.WHITE, PieceType.PAWN)
+    b.squares[sq(3, 2)] = (Color.BLACK, PieceType.PAWN)
+    b.squares[sq(3, 7)] = (Color.BLACK, PieceType.ROOK)
+    b.squares[sq(0, 7)] = (Color.BLACK, PieceType.KING)
+    b.turn = Color.WHITE
+    b.ep_square = sq(2, 2)
+    moves = generate_legal_moves(b)
+    assert not any(m.is_en_passant for m in moves)
+
+
 # ---------------------------------------------------------------------------
 # is_square_attacked
 # ---------------------------------------------------------------------------
@@ -201,3 +234,116 @@ def test_square_attacked_by_knight():
     attacked = {sq(2,3), sq(2,5), sq(3,2), sq(3,6), sq(5,2), sq(5,6), sq(6,3), sq(6,5)}
     for s in attacked:
         assert is_square_attacked(b, s, Color.WHITE), f'sq {s} should be attacked'
+
+
+def test_square_attacked_by_slider_stops_at_blocker():
+    b = Board()
+    b.squares[sq(7, 0)] = (Color.WHITE, PieceType.ROOK)
+    b.squares[sq(4, 0)] = (Color.BLACK, PieceType.PAWN)
+    assert is_square_attacked(b, sq(4, 0), Color.WHITE)
+    assert not is_square_attacked(b, sq(3, 0), Color.WHITE)
+    assert is_square_attacked(b, sq(7, 7), Color.WHITE)
+
+
+# ---------------------------------------------------------------------------
+# Single-move validation
+# ---------------------------------------------------------------------------
+
+def test_pseudo_legal_matches_generation(start_board):
+    legal = set(generate_legal_moves(start_board))
+    for from_sq in range(48, 64):
+        for to_sq in range(64):
+            move = Move(from_sq, to_sq)
+            assert is_pseudo_legal(start_board, move) == (move in legal), move
+    assert not is_pseudo_legal(start_board, Move.from_uci('e7e5'))  # not White's piece
+    assert not is_pseudo_legal(start_board, Move.from_uci('e1g1'))  # no castle flag
+
+
+def test_legal_move_rejects_pinned_piece():
+    b = Board()
+    b.squares[sq(7, 4)] = (Color.WHITE, PieceType.KING)
+    b.squares[sq(5, 4)] = (Color.WHITE, PieceType.ROOK)
+    b.squares[sq(3, 4)] = (Color.BLACK, PieceType.ROOK)
+    b.squares[sq(0, 0)] = (Color.BLACK, PieceType.KING)
+    b.turn = Color.WHITE
+    sideways = Move(sq(5, 4), sq(5, 0))
+    assert is_pseudo_legal(b, sideways)
+    assert not is_legal_move(b, sideways)
+    assert is_legal_move(b, Move(sq(5, 4), sq(3, 4)))
+
+
+def test_captures_split_off_on_request(start_board):
+    start_board.make_move(Move.from_uci('e2e4'))
+    start_board.make_move(Move.from_uci('d7d5'))
+    everything = generate_legal_moves(start_board)
+    assert everything[0] == Move.from_uci('e4d5')  # captures lead
+    captures = []
+    rest = generate_legal_moves(start_board, captures)
+    assert captures == [Move.from_uci('e4d5')]
+    assert captures + rest == everything
+
+
+def test_cached_moves_are_handed_out_as_copies(start_board):
+    first = generate_legal_moves(start_board)
+    first.clear()
+    captures = [Move.from_uci('a2a3')]
+    rest = generate_legal_moves(start_board, captures)
+    assert len(rest) == 20 and len(captures) == 1
+    rest.pop()
+    start_board.make_move(Move.from_uci('e2e4'))
+    start_board.undo_move()
+    assert len(generate_legal_moves(start_board)) == 20
+
+
+def test_has_legal_move():
+    b = Board()
+    b.squares[sq(0, 0)] = (Color.BLACK, PieceType.KING)
+    b.squares[sq(2, 1)] = (Color.WHITE, PieceType.QUEEN)
+    b.squares[sq(2, 2)] = (Color.WHITE, PieceType.KING)
+    b.turn = Color.BLACK
+    assert not has_legal_move(b)  # stalemate
+    # A rook pinned along the back rank can still slide along the pin
+    b.squares[sq(2, 1)] = (Color.WHITE, PieceType.PAWN)
+    b.squares[sq(2, 2)] = None
+    b.squares[sq(1, 2)] = (Color.WHITE, PieceType.KING)
+    b.squares[sq(0, 4)] = (Color.BLACK, PieceType.ROOK)
+    b.squares[sq(0, 7)] = (Color.WHITE, PieceType.ROOK)
+    assert has_legal_move(b)
+    assert {m.from_sq for m in generate_legal_moves(b)} == {sq(0, 4)}
+
+
+# ---------------------------------------------------------------------------
+# Perft
+# ---------------------------------------------------------------------------
+
+def _perft(board, depth):
+    moves = generate_legal_moves(board)
+    if depth == 1:
+        return len(moves)
+    total = 0
+    for move in moves:
+        board.make_move(move)
+        total += _perft(board, depth - 1)
+        board.undo_move()
+    return total
+
+
+def test_perft_start_position(start_board):
+    assert [_perft(start_board, d) for d in (1, 2, 3)] == [20, 400, 8902]
+
+
+def test_perft_castling_and_promotions():
+    # "Kiwipete": castling both ways, pins, en passant and promotions
+    rows = [
+        'r...k..r', 'p.ppqpb.', 'bn..pnp.', '...PN...',
+        '.p..P...', '..N..Q.p', 'PPPBBPPP', 'R...K..R',
+    ]
+    letters = {'p': PieceType.PAWN, 'n': PieceType.KNIGHT, 'b': PieceType.BISHOP,
+               'r': PieceType.ROOK, 'q': PieceType.QUEEN, 'k': PieceType.KING}
+    b = Board()
+    for row, line in enumerate(rows):
+        for col, ch in enumerate(line):
+            if ch != '.':
+                color = Color.WHITE if ch.isupper() else Color.BLACK
+                b.squares[sq(row, col)] = (color, letters[ch.lower()])
+    assert [_perft(b, d) for d in (1, 2)] == [48, 2039]
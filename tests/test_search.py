@@ -1,9 +1,8 @@
 """Tests for search.minimax — MinimaxSearcher."""
 import pytest
 
-from engine.board import Board
 from engine.constants import Color, PieceType, sq
-from engine.game import GameState, GameResult
+from engine.game import GameState
 from engine.move import Move
 from evaluators.material import SimpleMaterialEvaluator
 from evaluators.positional import PositionalEvaluator
@@ -16,29 +15,7 @@ def _make_searcher(depth=2):
 
 def _bare_game(white_pieces, black_pieces, turn=Color.WHITE):
     """Create a minimal GameState with given pieces."""
-    g = GameState.__new__(GameState)
-    g.board = Board()
-    g.board.squares = [None] * 64
-    for s, pt in white_pieces:
-        g.board.squares[s] = (Color.WHITE, pt)
-    for s, pt in black_pieces:
-        g.board.squares[s] = (Color.BLACK, pt)
-    g.board.turn = turn
-    g.board.castling_rights = {'K': False, 'Q': False, 'k': False, 'q': False}
-    g.board.ep_square = None
-    g.board.halfmove_clock = 0
-    g.board.fullmove_number = 1
-    g.board._history = []
-    from engine.zobrist import ZobristHasher
-    g._hasher = ZobristHasher()
-    g._position_counts = {}
-    g._move_history = []
-    g._cached_legal = None
-    g.result = GameResult.ONGOING
-    g.draw_reason = None
-    g.resignation = None
-    g._record_position()
-    return g
+    return GameState.from_pieces(white_pieces, black_pieces, turn)
 
 
 # ---------------------------------------------------------------------------
@@ -56,26 +33,13 @@ def test_best_move_returns_move_from_start():
 def test_best_move_none_when_no_moves():
     """No legal moves → best_move returns None."""
     # Put black king in checkmate (no legal moves)
-    b = Board()
-    b.squares[sq(0,0)] = (Color.BLACK, PieceType.KING)
-    b.squares[sq(1,2)] = (Color.WHITE, PieceType.QUEEN)  # covers a8 and b8
-    b.squares[sq(2,1)] = (Color.WHITE, PieceType.QUEEN)  # covers a7 (and mates)
-    b.squares[sq(7,4)] = (Color.WHITE, PieceType.KING)
-    b.turn = Color.BLACK
-    b.castling_rights = {'K': False, 'Q': False, 'k': False, 'q': False}
-
-    g = GameState.__new__(GameState)
-    g.board = b
-    from engine.zobrist import ZobristHasher
-    g._hasher = ZobristHasher()
-    g._position_counts = {}
-    g._move_history = []
-    g._cached_legal = None
-    g.result = GameResult.ONGOING
-    g.draw_reason = None
-    g.resignation = None
-    g._record_position()
-    g._update_result()  # detect checkmate
+    g = _bare_game(
+        [(sq(1,2), PieceType.QUEEN),   # covers a8 and b8
+         (sq(2,1), PieceType.QUEEN),   # covers a7 (and mates)
+         (sq(7,4), PieceType.KING)],
+        [(sq(0,0), PieceType.KING)],
+        turn=Color.BLACK,
+    )  # checkmate is detected on construction
 
     s = _make_searcher(depth=1)
     # game is over so no moves, but searcher works on board directly
@@ -153,6 +117,68 @@ def test_nodes_searched_increases_with_depth():
     assert s2.nodes_searched > s1.nodes_searched
 
 
+def test_alpha_beta_prunes_below_full_tree():
+    g = GameState()
+    s = MinimaxSearcher(SimpleMaterialEvaluator(), depth=3)
+    s.best_move(g)
+    # Plain minimax visits every node of the perft tree below the root
+    assert s.nodes_searched < 20 + 400 + 8902
+
+
+def test_captures_ordered_most_valuable_victim_first():
+    from search.minimax import _ordered_moves
+    g = _bare_game(
+        [(sq(7,0), PieceType.KING), (sq(4,3), PieceType.PAWN), (sq(4,7), PieceType.QUEEN)],
+        [(sq(0,0), PieceType.KING), (sq(3,4), PieceType.QUEEN), (sq(1,7), PieceType.PAWN)],
+    )
+    moves = _ordered_moves(g)
+    assert moves[:2] == [Move.from_uci('d4e5'), Move.from_uci('h4h7')]
+    assert all(g.board.piece_at(m.to_sq) is None for m in moves[2:])
+
+
+# ---------------------------------------------------------------------------
+# Transposition table
+# ---------------------------------------------------------------------------
+
+def _middlegame():
+    g = GameState()
+    for uci in ('e2e4', 'e7e5', 'g1f3', 'b8c6', 'f1c4', 'g8f6'):
+        assert g.make_move(Move.from_uci(uci))
+    return g
+
+
+def test_transposition_table_keeps_result():
+    g = _middlegame()
+    s = MinimaxSearcher(SimpleMaterialEvaluator(), depth=3)
+    first = s.best_move(g)
+    assert s.tt
+    fresh = MinimaxSearcher(SimpleMaterialEvaluator(), depth=3)
+    assert fresh.best_move(g) == first
+    # A second search reuses the stored entries
+    nodes = s.nodes_searched
+    assert s.best_move(g) == first
+    assert s.nodes_searched < nodes
+
+
+def test_stale_tt_move_is_skipped():
+    g = _middlegame()
+    expected = MinimaxSearcher(SimpleMaterialEvaluator(), depth=2).best_move(g)
+    s = MinimaxSearcher(SimpleMaterialEvaluator(), depth=2)
+    # An entry too shallow to cut off, whose move is illegal here
+    g.board.make_move(expected)
+    s.tt[g.board.zobrist] = (-1, 0, 0, Move.from_uci('a2a3'))
+    g.board.undo_move()
+    assert s.best_move(g) == expected
+
+
+def test_transposition_table_is_bounded(monkeypatch):
+    import search.minimax as minimax
+    monkeypatch.setattr(minimax, 'TT_MAX_ENTRIES', 50)
+    s = MinimaxSearcher(SimpleMaterialEvaluator(), depth=2)
+    s.best_move(GameState())
+    assert 0 < len(s.tt) <= 50
+
+
 # ---------------------------------------------------------------------------
 # Works with positional evaluator
 # ---------------------------------------------------------------------------
@@ -0,0 +1,101 @@
+"""Tests for api.session — GameSession and SessionManager."""
+import time
+
+import api.executor
+import api.session
+from api.executor import get_ai_executor, shutdown_ai_executor
+from api.session import EVALUATOR_REGISTRY, GameSession, SessionManager, _ai_move_worker
+from evaluators.material import SimpleMaterialEvaluator
+
+
+def test_ai_is_looked_up_by_registry_key(monkeypatch):
+    # Registered under a key that differs from the evaluator's own name
+    monkeypatch.setitem(EVALUATOR_REGISTRY, 'greedy', SimpleMaterialEvaluator)
+    session = GameSession('s', 'hvc', None, 'greedy', black_depth=2)
+    assert session.white_ai is None
+    assert session.black_ai == ('greedy', 2)
+    assert session.is_human_turn()
+
+    session.make_move(52, 36)  # e2e4
+    assert session.current_ai() == ('greedy', 2)
+    uci = _ai_move_worker(session.game.board.copy(), *session.current_ai())
+    assert session.move_from_uci(uci) is not None
+
+
+def test_worker_keeps_its_table_between_moves(monkeypatch):
+    monkeypatch.setattr(api.session, '_worker_searchers', {})
+    board = GameSession('s', 'cvc', 'material', 'material').game.board
+    _ai_move_worker(board.copy(), 'material', 2)
+    searcher = api.session._worker_searchers['material']
+    cold_nodes = searcher.nodes_searched
+    assert searcher.tt
+
+    _ai_move_worker(board.copy(), 'material', 2)
+    assert api.session._worker_searchers['material'] is searcher
+    assert searcher.nodes_searched < cold_nodes
+
+    _ai_move_worker(board.copy(), 'material', 3)
+    assert searcher.depth == 3
+
+
+# ---------------------------------------------------------------------------
+# SessionManager
+# ---------------------------------------------------------------------------
+
+def test_lru_eviction_follows_use():
+    manager = SessionManager(max_sessions=2)
+    a = manager.create_session('hvh')
+    b = manager.create_session('hvh')
+    manager.get(a.session_id)  # b is now least recently used
+    c = manager.create_session('hvh')
+    assert manager.get(b.session_id) is None
+    assert manager.get(a.session_id) is a and manager.get(c.session_id) is c
+
+
+def test_lru_eviction_skips_sessions_with_a_socket():
+    manager = SessionManager(max_sessions=2)
+    a = manager.create_session('hvh')
+    a.websockets.add(object())
+    b = manager.create_session('hvh')
+    manager.create_session('hvh')
+    assert manager.get(a.session_id) is a
+    assert manager.get(b.session_id) is None
+
+    # With a socket on every session the cap still holds
+    manager.get(a.session_id)
+    for session in list(manager._sessions.values()):
+        session.websockets.add(object())
+    manager.create_session('hvh')
+    assert len(manager) == 2
+    assert manager.get(a.session_id) is a
+
+
+def test_expire_uses_ttl_and_disconnect_grace():
+    manager = SessionManager(ttl=100.0, disconnect_grace=10.0)
+    idle = manager.create_session('hvh')
+    closed = manager.create_session('hvh')
+    closed.disconnected = True
+    live = manager.create_session('hvh')
+    live.websockets.add(object())
+    fresh = manager.create_session('hvh')
+
+    now = time.monotonic()
+    idle.last_active = closed.last_active = now - 50
+    live.last_active = now - 1000
+    assert manager.expire() == 1
+    assert manager.get(closed.session_id) is None
+
+    idle.last_active = now - 150
+    assert manager.expire() == 1
+    assert manager.get(idle.session_id) is None
+    assert manager.get(live.session_id) is live
+    assert manager.get(fresh.session_id) is fresh
+
+
+def test_ai_pool_is_created_on_first_use():
+    shutdown_ai_executor()
+    assert api.executor._ai_executor is None  # importing api.session made none
+    pool = get_ai_executor()
+    assert get_ai_executor() is pool
+    shutdown_ai_executor()
+    assert api.executor._ai_executor is None
@@ -246,11 +246,18 @@ function connectWS(sid) {
   const proto = location.protocol === 'https:' ? 'wss' : 'ws';
   const url   = `${proto}://${location.host}/ws/${sid}`;
   ws = new WebSocket(url);
+  ws.binaryType = 'arraybuffer';
 
   ws.onopen    = () => setStatus('Connected — game started.');
   ws.onclose   = () => setStatus('Connection closed.');
   ws.onerror   = () => setStatus('WebSocket error.');
-  ws.onmessage = (evt) => handleMessage(JSON.parse(evt.data));
+  ws.onmessage = (evt) => handleMessage(JSON.parse(decodeFrame(evt.data)));
+}
+
+// The server sends JSON as binary frames; decode them back to text.
+const frameDecoder = new TextDecoder();
+function decodeFrame(data) {
+  return typeof data === 'string' ? data : frameDecoder.decode(data);
 }
 
 function handleMessage(msg) {
@@ -265,9 +272,13 @@ function handleMessage(msg) {
       setStatus('AI is thinking…');
       break;
 
-    case 'ai_move':
-      lastMove = { from: msg.from_sq, to: msg.to_sq };
-      setStatus(`AI played ${msg.uci || ''}`);
+    case 'ai_turn':
+      // One frame per AI move: the move, the new state and any result
+      lastMove  = { from: msg.move.from_sq, to: msg.move.to_sq };
+      gameState = msg.state;
+      renderBoard(gameState);
+      updateInfo(gameState);
+      if (msg.game_over) handleGameOver(msg.game_over);
       break;
 
     case 'game_over':